@@ -1,11 +1,17 @@
 import os
+import uuid
 import streamlit as st
 from dotenv import load_dotenv
 from pathlib import Path
 from PIL import Image
 import google.generativeai as genai
 from utils.gemini_client import GeminiClient
+from utils.admission import ADMITTED, ANSWER, ITINERARY, get_admission_controller
 from utils.itinerary_generator import ItineraryGenerator
+from utils.message_store import MessageHistory
+from utils.profiler import maybe_start_profiler
+from utils.speculative_translation import get_speculative_translator
+from utils.storage import SessionStore, get_store
 
 # Load environment variables from .env file
 env_path = Path('.') / '.env'
@@ -31,9 +37,17 @@ UI_TEXT = {
     "error_message": "I apologize, but I'm having technical difficulties. Please try again.",
     "temple_query": "Tell me about famous temples in Andhra Pradesh",
     "beach_query": "Show me beautiful beach destinations in Andhra Pradesh",
-    "plan_query": "Help me plan a 3-day trip to Andhra Pradesh"
+    "plan_query": "Help me plan a 3-day trip to Andhra Pradesh",
+    "busy_message": "We're helping a lot of travellers right now. Please try your trip plan again in a minute."
 }
 
+# "parallel" streams per-day itinerary generation, "single" uses one long call
+ITINERARY_MODE = os.getenv("SAANCHARI_ITINERARY_MODE", "parallel")
+
+# "direct" generates Hindi/Telugu itineraries in one call, "translate" generates
+# in English and translates the result
+LOCALIZATION_MODE = os.getenv("SAANCHARI_LOCALIZATION_MODE", "direct")
+
 # Available languages
 LANGUAGES = ["English", "Hindi", "Telugu"]
 LANGUAGE_CODES = {
@@ -42,56 +56,80 @@ LANGUAGE_CODES = {
     "Telugu": "Telugu"
 }
 
+# Shared store for conversation state and caches (see SAANCHARI_STORE_URL)
+store = get_store()
+session_store = SessionStore(store)
+
+def get_session_id():
+    """Get the session id from the URL, creating one if needed.
+    
+    Keeping it in the URL lets any worker process pick the conversation
+    back up from the shared store after a reconnect.
+    """
+    params = st.experimental_get_query_params()
+    session_id = params.get("sid", [None])[0]
+    if not session_id:
+        session_id = uuid.uuid4().hex
+        params["sid"] = session_id
+        st.experimental_set_query_params(**params)
+    return session_id
+
+def save_session():
+    """Persist the conversation so other workers can serve this session."""
+    session_store.save(st.session_state.session_id, {
+        "history": st.session_state.messages.to_state(),
+        "language": st.session_state.language
+    })
+
 # Initialize session state
+if "session_id" not in st.session_state:
+    st.session_state.session_id = get_session_id()
+    saved_state = session_store.load(st.session_state.session_id) or {}
+    st.session_state.messages = MessageHistory.from_state(
+        saved_state.get("history"), st.session_state.session_id, store
+    )
+    st.session_state.language = saved_state.get("language", "English")
 if "messages" not in st.session_state:
-    st.session_state.messages = []
+    st.session_state.messages = MessageHistory(st.session_state.session_id, store)
 if "language" not in st.session_state:
     st.session_state.language = "English"
 
+# Operator-only profiling of the next N reruns (SAANCHARI_PROFILE_TOKEN /
+# SAANCHARI_PROFILE_RERUNS); returns None without doing any work when off
+rerun_profiler = maybe_start_profiler(
+    st.session_state, st.experimental_get_query_params, __file__,
+    session=st.session_state.session_id, language=st.session_state.language, route="render"
+)
+
+
+def rerun():
+    """End this rerun's profile, if any, and start a new rerun."""
+    if rerun_profiler:
+        rerun_profiler.stop()
+    st.rerun()
+
 # Initialize Gemini client
 gemini_client = GeminiClient()
 
 # Initialize Itinerary Generator
 itinerary_generator = ItineraryGenerator(gemini_client)
 
+# Process-wide admission control shared by all sessions
+admission = get_admission_controller()
+
+# Optionally translate each new answer into the other languages in the background
+# so switching language shows history without waiting
+if os.getenv("SAANCHARI_SPECULATIVE_TRANSLATION") == "1":
+    speculative_translator = get_speculative_translator(gemini_client, LANGUAGES)
+else:
+    speculative_translator = None
+
 # Function to translate text using Gemini API
-def translate_text(text, target_lang):
-    """Translate text using Gemini API"""
-    if not text or target_lang == "English":
-        return text
-        
+def translate_text(text, target_lang, route="chunk_translation"):
+    """Translate text using Gemini API. `route` selects the model tier."""
     try:
-        # Initialize Gemini with API key
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            st.error("GEMINI_API_KEY not found in environment variables")
-            return text
-            
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-1.5-pro')
-        
-        # Split long text into chunks to avoid token limits
-        max_chunk_length = 1000
-        if len(text) <= max_chunk_length:
-            chunks = [text]
-        else:
-            chunks = [text[i:i+max_chunk_length] for i in range(0, len(text), max_chunk_length)]
-            
-        translated_chunks = []
-        for chunk in chunks:
-            try:
-                prompt = f"Translate the following text to {target_lang}. Only return the translated text without any additional text or explanations. Here's the text to translate: \"{chunk}\""
-                response = model.generate_content(prompt)
-                if hasattr(response, 'text') and response.text:
-                    translated_chunks.append(response.text.strip())
-                else:
-                    translated_chunks.append(chunk)  # Fallback to original text if translation fails
-            except Exception as e:
-                st.warning(f"Error translating chunk: {str(e)}")
-                translated_chunks.append(chunk)  # Fallback to original text on error
-                
-        return " ".join(translated_chunks)
-        
+        # Chunking, glossary protection and caching live in GeminiClient.translate
+        return gemini_client.translate(text, target_lang, route=route)
     except Exception as e:
         st.warning(f"Translation failed: {str(e)}")
         return text
@@ -106,7 +144,10 @@ def get_text(key, target_lang=None):
         return UI_TEXT.get(key, key)
     
     text = UI_TEXT.get(key, key)
-    return translate_text(text, target_lang)
+    if isinstance(text, list):
+        # e.g. the quick action labels; each label is translated and cached on its own
+        return [translate_text(item, target_lang, route="ui_translation") for item in text]
+    return translate_text(text, target_lang, route="ui_translation")
 
 # Page configuration
 st.set_page_config(
@@ -312,15 +353,17 @@ with col2:
     )
     if selected_language != st.session_state.language:
         st.session_state.language = selected_language
-        st.rerun()
+        save_session()
+        rerun()
 
 # Welcome message
 if not st.session_state.messages:
-    st.session_state.messages.append({
-        "role": "assistant",
-        "content": get_text("welcome_message"),
-        "original_content": UI_TEXT["welcome_message"]
-    })
+    st.session_state.messages.append(
+        "assistant",
+        get_text("welcome_message"),
+        original_content=UI_TEXT["welcome_message"],
+        language=st.session_state.language
+    )
 
 # Chat interface
 #st.markdown("### Chat with Saanchari")
@@ -330,41 +373,69 @@ col1, col2, col3 = st.columns(3)
 with col1:
     if st.button(get_text("quick_actions")[0], key="temples"):
         user_input = get_text("temple_query")
-        st.session_state.messages.append({"role": "user", "content": user_input})
-        st.rerun()
+        st.session_state.messages.append("user", user_input)
+        save_session()
+        rerun()
         
 with col2:
     if st.button(get_text("quick_actions")[1], key="beaches"):
         user_input = get_text("beach_query")
-        st.session_state.messages.append({"role": "user", "content": user_input})
-        st.rerun()
+        st.session_state.messages.append("user", user_input)
+        save_session()
+        rerun()
         
 with col3:
     if st.button(get_text("quick_actions")[2], key="plan"):
         user_input = get_text("plan_query")
-        st.session_state.messages.append({"role": "user", "content": user_input})
-        st.rerun()
+        st.session_state.messages.append("user", user_input)
+        save_session()
+        rerun()
+
+def render_message(message):
+    """Render one chat message in the current language where a translation is available."""
+    if message.role == "user":
+        st.markdown(f'<div class="user-message">{message.content}</div>', unsafe_allow_html=True)
+        return
+    content = message.content
+    if speculative_translator and message.language and message.language != st.session_state.language:
+        # Cache-only: shows the original until the background translation is ready
+        content = speculative_translator.lookup(content, message.language, st.session_state.language) or content
+    if "itinerary" in message.type:
+        st.markdown(f'<div class="itinerary-container">{content}</div>', unsafe_allow_html=True)
+    else:
+        st.markdown(f'<div class="bot-message">{content}</div>', unsafe_allow_html=True)
 
 # Display chat messages
 chat_container = st.container()
 with chat_container:
+    # Turns moved out of memory by the session size cap are read back on demand
+    if st.session_state.messages.spilled:
+        with st.expander(f"Earlier messages ({st.session_state.messages.spilled})"):
+            if st.button("Load earlier messages", key="load_spilled"):
+                for message in st.session_state.messages.load_spilled():
+                    render_message(message)
     for message in st.session_state.messages:
-        if message["role"] == "user":
-            st.markdown(f'<div class="user-message">{message["content"]}</div>', unsafe_allow_html=True)
-        else:
-            if "itinerary" in message.get("type", ""):
-                st.markdown(f'<div class="itinerary-container">{message["content"]}</div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="bot-message">{message["content"]}</div>', unsafe_allow_html=True)
+        render_message(message)
+
+# Operator view of load: admission control and per-tier model latency
+if os.getenv("SAANCHARI_SHOW_METRICS") == "1":
+    with st.sidebar:
+        st.markdown("#### Admission")
+        st.json(admission.metrics())
+        st.markdown("#### Model tiers")
+        st.json(gemini_client.router.stats())
+        if speculative_translator:
+            st.markdown("#### Background translation")
+            st.json(speculative_translator.metrics())
 
 # Check for unprocessed user messages (from buttons or chat input)
 should_process_response = False
 latest_user_message = None
 
 # Check if last message is a user message without a corresponding AI response
-if st.session_state.messages and st.session_state.messages[-1]["role"] == "user":
+if st.session_state.messages and st.session_state.messages[-1].role == "user":
     should_process_response = True
-    latest_user_message = st.session_state.messages[-1]["content"]
+    latest_user_message = st.session_state.messages[-1].content
 
 # Chat input container
 with st.container():
@@ -373,7 +444,7 @@ with st.container():
 
 if user_input:
     # Add user message
-    st.session_state.messages.append({"role": "user", "content": user_input})
+    st.session_state.messages.append("user", user_input)
     should_process_response = True
     latest_user_message = user_input
 
@@ -384,28 +455,57 @@ if should_process_response and latest_user_message:
             keywords = ["itinerary", "plan", "trip", "schedule", "यात्रा कार्यक्रम", "योजना", "ప్రయాణ కార్యక్రమం", "ప్రణాళిక"]
             is_itinerary_request = any(keyword.lower() in latest_user_message.lower() for keyword in keywords)
             
-            if is_itinerary_request:
-                # Generate itinerary in English first
-                itinerary = itinerary_generator.generate_itinerary(latest_user_message, "English")
-                # Then translate if needed
-                if st.session_state.language != "English":
-                    itinerary = translation_service.translate_text(itinerary, st.session_state.language)
+            # Admission control: per-session rate limit plus a global in-flight cap
+            request_kind = ITINERARY if is_itinerary_request else ANSWER
+            with admission.admit(st.session_state.session_id, request_kind) as decision:
+                if rerun_profiler:
+                    rerun_profiler.tag(route=f"{request_kind}-{decision}")
+                if decision != ADMITTED and is_itinerary_request:
+                    # Overloaded: serve an equivalent cached itinerary or ask the user to retry
+                    itinerary = itinerary_generator.get_cached_itinerary(latest_user_message, st.session_state.language)
+                    if itinerary:
+                        st.session_state.messages.append("assistant", itinerary, type="itinerary", language=st.session_state.language)
+                    else:
+                        st.session_state.messages.append("assistant", get_text("busy_message"), language=st.session_state.language)
+                elif decision != ADMITTED:
+                    # Overloaded: answer from cache or local fallback content
+                    response = gemini_client.get_degraded_response(latest_user_message, st.session_state.language)
+                    st.session_state.messages.append("assistant", response, language=st.session_state.language)
+                elif is_itinerary_request and st.session_state.language != "English" and LOCALIZATION_MODE == "direct":
+                    # Generate straight in the target language; falls back to
+                    # generate-then-translate if the output fails validation
+                    itinerary = itinerary_generator.generate_localized_itinerary(
+                        latest_user_message, st.session_state.language
+                    )
+                
+                    st.session_state.messages.append("assistant", itinerary, type="itinerary", language=st.session_state.language)
+                elif is_itinerary_request:
+                    # Generate itinerary in English first
+                    if ITINERARY_MODE == "parallel" and st.session_state.language == "English":
+                        # Show each day as soon as it and all earlier days are ready
+                        itinerary_placeholder = st.empty()
+                        itinerary_parts = []
+                        for fragment in itinerary_generator.stream_itinerary(latest_user_message, "English"):
+                            itinerary_parts.append(fragment)
+                            itinerary_placeholder.markdown(
+                                f'<div class="itinerary-container">{"".join(itinerary_parts)}</div>',
+                                unsafe_allow_html=True
+                            )
+                        itinerary = "".join(itinerary_parts)
+                    elif ITINERARY_MODE == "parallel":
+                        itinerary = itinerary_generator.generate_itinerary_parallel(latest_user_message, "English")
+                    else:
+                        itinerary = itinerary_generator.generate_itinerary(latest_user_message, "English")
+                    # Then translate if needed
+                    if st.session_state.language != "English":
+                        itinerary = translate_text(itinerary, st.session_state.language)
                 
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": itinerary,
-                    "type": "itinerary",
-                    "original_content": itinerary
-                })
-            else:
-                # Get response in the target language
-                response = gemini_client.get_tourism_response(latest_user_message, st.session_state.language)
+                    st.session_state.messages.append("assistant", itinerary, type="itinerary", language=st.session_state.language)
+                else:
+                    # Get response in the target language
+                    response = gemini_client.get_tourism_response(latest_user_message, st.session_state.language)
                 
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": response,
-                    "original_content": response
-                })
+                    st.session_state.messages.append("assistant", response, language=st.session_state.language)
                 
         except Exception as e:
             error_msg = f"{get_text('error_message')} Error: {str(e)}"
@@ -413,13 +513,14 @@ if should_process_response and latest_user_message:
             if st.session_state.language != "English":
                 error_msg = translate_text(error_msg, st.session_state.language)
             
-            st.session_state.messages.append({
-                "role": "assistant",
-                "content": error_msg,
-                "original_content": error_msg
-            })
+            st.session_state.messages.append("assistant", error_msg, language=st.session_state.language)
     
-    st.rerun()
+    # Translate the new answer into the other languages while the user reads it
+    if speculative_translator and st.session_state.messages[-1].role == "assistant":
+        speculative_translator.submit(st.session_state.messages[-1].content, st.session_state.language)
+    
+    save_session()
+    rerun()
 
 # Add sticky footer at the bottom
 st.markdown("""
@@ -428,3 +529,6 @@ st.markdown("""
     <small style='color: #07546B;'>Kshipani Tech Ventures Pvt Ltd.</small>
 </div>
 """, unsafe_allow_html=True)
+
+if rerun_profiler:
+    rerun_profiler.stop()
@@ -0,0 +1,98 @@
+"""
+Open-loop load test of admission control on the fake backend.
+
+The fake backend serves `--capacity` requests at a time, so offered load
+beyond capacity / latency saturates it. Without admission control requests
+pile up at the backend and tail latency grows with the overload. With it,
+excess answers degrade to local content and excess itineraries are queued
+briefly or shed, keeping tail latency bounded.
+
+    python benchmarks/admission_load_test.py --rates 40 80 160 320
+"""
+import sys
+import time
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.admission import ADMITTED, ANSWER, ITINERARY, SHED, AdmissionController
+from utils.fake_backend import FakeGenAIClient, LatencyProfile
+from utils.gemini_client import GeminiClient
+from utils.model_router import ModelRouter
+from utils.stats import percentile
+from utils.storage import MemoryStore
+
+
+def run(rate: float, duration: float, use_admission: bool, args) -> dict:
+    backend = FakeGenAIClient(default_profile=LatencyProfile(base_s=args.latency), max_concurrency=args.capacity)
+    client = GeminiClient(client=backend, store=MemoryStore(), router=ModelRouter(hedging=False))
+    controller = AdmissionController(
+        max_in_flight=args.capacity, max_queue=4 * args.capacity,
+        session_rate=5, session_burst=10,
+        answer_timeout_s=5 * args.latency, itinerary_timeout_s=20 * args.latency
+    )
+    rng = random.Random(3)
+    latencies, outcomes = [], []
+    lock = threading.Lock()
+
+    def handle(index: int, arrival: float, session: str, kind: str):
+        query = f"Question {index}"
+        if use_admission:
+            with controller.admit(session, kind) as decision:
+                if decision == ADMITTED:
+                    client.generate("tourism", query=query, language="English")
+                elif decision != SHED:
+                    client.get_degraded_response(query)
+        else:
+            decision = ADMITTED
+            client.generate("tourism", query=query, language="English")
+        with lock:
+            latencies.append(time.perf_counter() - arrival)
+            outcomes.append(decision)
+
+    with ThreadPoolExecutor(max_workers=2048) as pool:
+        start = time.perf_counter()
+        index = 0
+        while time.perf_counter() - start < duration:
+            kind = ITINERARY if rng.random() < 0.2 else ANSWER
+            pool.submit(handle, index, time.perf_counter(), f"session-{rng.randrange(args.sessions)}", kind)
+            index += 1
+            time.sleep(rng.expovariate(rate))
+
+    latencies_ms = [latency * 1000 for latency in latencies]
+    metrics = controller.metrics()
+    return {
+        "p50": percentile(latencies_ms, 50),
+        "p99": percentile(latencies_ms, 99),
+        "max": max(latencies_ms),
+        "degraded": outcomes.count("degraded") / len(outcomes),
+        "shed": outcomes.count(SHED),
+        "max_queue": metrics["max_queue_depth"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rates", type=float, nargs="+", default=[40, 80, 160, 320])
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds of offered load per run")
+    parser.add_argument("--latency", type=float, default=0.1, help="fake backend latency (s)")
+    parser.add_argument("--capacity", type=int, default=8, help="concurrent requests the backend serves")
+    parser.add_argument("--sessions", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"backend capacity ~{args.capacity / args.latency:.0f} req/s")
+    print(f"{'rate':>5} {'admission':<9} {'p50 ms':>7} {'p99 ms':>8} {'max ms':>8} "
+          f"{'degraded':>8} {'shed':>5} {'max queue':>9}")
+    for rate in args.rates:
+        for use_admission in (False, True):
+            result = run(rate, args.duration, use_admission, args)
+            print(f"{rate:>5.0f} {'on' if use_admission else 'off':<9} {result['p50']:>7.0f} {result['p99']:>8.0f} "
+                  f"{result['max']:>8.0f} {result['degraded']:>8.1%} {result['shed']:>5} {result['max_queue']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Tokens saved and name consistency of glossary-protected translation.
+
+Each corpus line is translated to Hindi and Telugu twice on the fake
+backend: as plain text, and with glossary terms, numbers, prices and times
+masked. The fake translator renders names in their approved form only with
+probability `--fidelity`, like a model that is inconsistent with names.
+Consistency is the share of glossary terms in the source whose approved
+form appears in the output; literals is the share of prices, times and
+numbers that come back unchanged. Tokens are estimated as characters / 4
+over system instruction, content and output.
+
+    python benchmarks/glossary_translation_bench.py --fidelity 0.7
+"""
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.fake_backend import FakeGenAIClient, LatencyProfile
+from utils.gemini_client import GeminiClient
+from utils.glossary import get_matcher, translate_protected
+from utils.storage import MemoryStore
+
+CORPUS = [
+    "Tirumala Balaji Temple opens at 3:00 AM; darshan tickets cost ₹300 per person.",
+    "Kailasagiri is 10 km from RK Beach, and the ropeway ride costs ₹120.",
+    "<strong>9:00 AM</strong> - Visit the Borra Caves, then drive 35 km to Araku Valley.",
+    "Try Pesarattu and Gongura pickle for breakfast in Vijayawada, around Rs. 80 a plate.",
+    "The Kanaka Durga Temple overlooks the Krishna River and Prakasam Barrage.",
+    "Srisailam is home to the Mallikarjuna Temple, one of the 12 Jyotirlingas of Lord Shiva.",
+    "<h3>🗓️ Day 2: Visakhapatnam</h3> Rushikonda Beach at 6:30 AM, Simhachalam at 11 AM.",
+    "Bamboo Chicken in Araku and Pootharekulu from Rajahmundry are must-tries.",
+    "A boat ride on the Godavari River to Papikondalu takes about 8 hours.",
+    "Lepakshi and Gandikota make a good 2-day trip from Tirupati.",
+    "Do not miss the Tirupati Laddu, blessed at the Sri Venkateswara Temple.",
+    "Lambasingi drops to 0°C in winter; carry warm clothes.",
+]
+
+
+def run(protected: bool, language: str, fidelity: float) -> dict:
+    backend = FakeGenAIClient(default_profile=LatencyProfile(base_s=0.0), name_fidelity=fidelity, seed=7)
+    client = GeminiClient(client=backend, store=MemoryStore())
+    matcher = get_matcher()
+    terms_found = terms_consistent = literals_found = literals_kept = 0
+
+    def translate(text):
+        return client.generate("translation", language=language, text=text)
+
+    for line in CORPUS:
+        output = translate_protected(line, language, translate) if protected else translate(line)
+        output = output or ""
+        for match in matcher.pattern.finditer(line):
+            if match.group("term"):
+                terms_found += 1
+                approved = matcher.glossary[match.group("term").lower()][language]
+                terms_consistent += approved in output
+            elif match.group("literal"):
+                literals_found += 1
+                literals_kept += match.group("literal") in output
+
+    chars = sum(call["prompt_chars"] + call["system_chars"] + call["output_chars"] for call in backend.calls)
+    return {
+        "calls": len(backend.calls),
+        "tokens": chars // 4,
+        "consistency": terms_consistent / terms_found,
+        "literals": literals_kept / literals_found,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fidelity", type=float, default=0.7,
+                        help="probability the fake translator uses the approved name form")
+    parser.add_argument("--languages", nargs="+", default=["Hindi", "Telugu"])
+    args = parser.parse_args()
+
+    print(f"{len(CORPUS)} corpus lines, fidelity={args.fidelity}")
+    print(f"{'language':<8} {'mode':<10} {'calls':>5} {'~tokens':>8} {'consistency':>11} {'literals':>8}")
+    for language in args.languages:
+        results = {}
+        for protected in (False, True):
+            mode = "protected" if protected else "plain"
+            results[mode] = run(protected, language, args.fidelity)
+            result = results[mode]
+            print(f"{language:<8} {mode:<10} {result['calls']:>5} {result['tokens']:>8} "
+                  f"{result['consistency']:>11.1%} {result['literals']:>8.1%}")
+        saved = 1 - results["protected"]["tokens"] / results["plain"]["tokens"]
+        print(f"{language:<8} tokens saved: {saved:.1%}")
+
+
+if __name__ == "__main__":
+    main()
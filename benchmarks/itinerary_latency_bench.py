@@ -0,0 +1,56 @@
+"""
+End-to-end itinerary latency, single call vs parallel per-day generation.
+
+Runs on the fake backend, whose latency grows with output length the way a
+real model's decode time does. For the parallel path, time to first day is
+reported too since that is when the UI starts showing content.
+
+    python benchmarks/itinerary_latency_bench.py --days 3 5 7
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.fake_backend import FakeGenAIClient, LatencyProfile
+from utils.gemini_client import GeminiClient
+from utils.itinerary_generator import ItineraryGenerator, ITINERARY_HEADER
+from utils.storage import MemoryStore
+
+
+def make_generator(profile: LatencyProfile) -> ItineraryGenerator:
+    # A fresh store per run so no call is served from cache
+    backend = FakeGenAIClient(default_profile=profile)
+    return ItineraryGenerator(GeminiClient(client=backend, store=MemoryStore()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", default=[3, 5, 7])
+    parser.add_argument("--base", type=float, default=0.2, help="fake time to first token (s)")
+    parser.add_argument("--per-1k-chars", type=float, default=1.0, help="fake decode time per 1000 output chars (s)")
+    args = parser.parse_args()
+
+    profile = LatencyProfile(base_s=args.base, per_1k_chars_s=args.per_1k_chars)
+    print(f"{'days':>4} {'single s':>9} {'parallel s':>11} {'first day s':>12} {'speedup':>8}")
+    for days in args.days:
+        request = f"Plan a {days} days trip to Andhra Pradesh"
+
+        start = time.perf_counter()
+        make_generator(profile).generate_itinerary(request)
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        first_day = None
+        for fragment in make_generator(profile).stream_itinerary(request):
+            if first_day is None and fragment is not ITINERARY_HEADER:
+                first_day = time.perf_counter() - start
+        parallel = time.perf_counter() - start
+
+        print(f"{days:>4} {single:>9.2f} {parallel:>11.2f} {first_day:>12.2f} {single / parallel:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
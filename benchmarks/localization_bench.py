@@ -0,0 +1,54 @@
+"""
+Latency and token cost of Hindi/Telugu itineraries, generate-then-translate
+vs direct target-language generation, on the fake backend.
+
+Token counts are estimated as characters / 4 over system instruction,
+content and output, which is enough to compare the two modes.
+
+    python benchmarks/localization_bench.py --days 3 5
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.fake_backend import FakeGenAIClient, LatencyProfile
+from utils.gemini_client import GeminiClient
+from utils.itinerary_generator import ItineraryGenerator
+from utils.storage import MemoryStore
+
+
+def run(mode: str, request: str, language: str, profile: LatencyProfile) -> tuple:
+    backend = FakeGenAIClient(default_profile=profile)
+    generator = ItineraryGenerator(GeminiClient(client=backend, store=MemoryStore()))
+    start = time.perf_counter()
+    if mode == "direct":
+        generator.generate_localized_itinerary(request, language)
+    else:
+        generator.generate_itinerary(request, language)
+    elapsed = time.perf_counter() - start
+    chars = sum(call["prompt_chars"] + call["system_chars"] + call["output_chars"] for call in backend.calls)
+    return elapsed, backend.call_count, chars // 4
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", default=[3, 5])
+    parser.add_argument("--base", type=float, default=0.2, help="fake time to first token (s)")
+    parser.add_argument("--per-1k-chars", type=float, default=1.0, help="fake decode time per 1000 output chars (s)")
+    args = parser.parse_args()
+
+    profile = LatencyProfile(base_s=args.base, per_1k_chars_s=args.per_1k_chars)
+    print(f"{'language':<8} {'days':>4} {'mode':<10} {'latency s':>9} {'calls':>5} {'~tokens':>8}")
+    for language in ("Hindi", "Telugu"):
+        for days in args.days:
+            request = f"Plan a {days} days trip to Andhra Pradesh"
+            for mode in ("translate", "direct"):
+                elapsed, calls, tokens = run(mode, request, language, profile)
+                print(f"{language:<8} {days:>4} {mode:<10} {elapsed:>9.2f} {calls:>5} {tokens:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Per-tier latency and hedging win rates for the model router.
+
+The fake backend gets two latency profiles: a slower "quality" model with a
+heavy tail and a faster "fast" model. Requests on a quality-tier route are
+run with hedging off and on, and end-to-end percentiles plus per-tier
+router stats are reported.
+
+    python benchmarks/model_router_bench.py --requests 300
+"""
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.fake_backend import FakeGenAIClient, LatencyProfile
+from utils.gemini_client import GeminiClient
+from utils.model_router import DEFAULT_TIERS, ModelRouter
+from utils.stats import percentile
+from utils.storage import MemoryStore
+
+PROFILES = {
+    DEFAULT_TIERS["quality"]: LatencyProfile(base_s=0.08, jitter_s=0.04, tail_prob=0.04, tail_s=0.6),
+    DEFAULT_TIERS["fast"]: LatencyProfile(base_s=0.03, jitter_s=0.02, tail_prob=0.02, tail_s=0.3),
+}
+
+
+def run(hedging: bool, requests: int, concurrency: int, route: str):
+    router = ModelRouter(hedging=hedging)
+    client = GeminiClient(client=FakeGenAIClient(profiles=PROFILES), store=MemoryStore(), router=router)
+
+    def one(index: int) -> float:
+        start = time.perf_counter()
+        # Distinct queries so every request reaches the backend
+        client.generate("tourism", route=route, query=f"Question {index}", language="English")
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        latencies = list(pool.map(one, range(requests)))
+    return latencies, router
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--route", default="tourism")
+    args = parser.parse_args()
+
+    for hedging in (False, True):
+        latencies, router = run(hedging, args.requests, args.concurrency, args.route)
+        latencies_ms = [latency * 1000 for latency in latencies]
+        print(f"hedging={'on' if hedging else 'off'}  route={args.route}  "
+              f"p50={percentile(latencies_ms, 50):.0f}ms  p95={percentile(latencies_ms, 95):.0f}ms  "
+              f"p99={percentile(latencies_ms, 99):.0f}ms  hedges={router.hedges_fired}")
+        for tier, stats in router.stats().items():
+            if not stats["calls"]:
+                continue
+            print(f"    {tier:<8} {stats['model']:<18} calls={stats['calls']:<4} "
+                  f"wins={stats['wins']:<4} ({stats['wins'] / args.requests:.0%})  "
+                  f"late={stats['late']:<3} "
+                  f"p50={stats['p50_s'] * 1000:.0f}ms  p95={stats['p95_s'] * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
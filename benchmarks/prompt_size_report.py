@@ -0,0 +1,119 @@
+"""
+Per-route prompt size and fake-backend latency, before and after the
+prompt template registry.
+
+"Before" rebuilds the original inline f-string prompts, where every
+instruction was sent as user content on every call. "After" renders the
+registered templates: fixed instructions go to `system_instruction` and
+only the slots are sent as content.
+
+    python benchmarks/prompt_size_report.py --repeat 20
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.fake_backend import FakeGenAIClient, LatencyProfile
+from utils.gemini_client import GeminiClient
+from utils.prompts import get_prompt
+from utils.storage import MemoryStore
+from utils.trip_parser import parse_trip_request
+
+QUERY = "Tell me about famous temples in Andhra Pradesh"
+TRIP_REQUEST = "Help me plan a 3-day trip to Andhra Pradesh"
+CHUNK = ("Tirupati is home to the Tirumala Venkateswara Temple, one of the most visited pilgrimage "
+         "sites in the world. ") * 9
+
+
+def legacy_tourism(user_query: str, language: str) -> str:
+    return f"You are a tourism guide for Andhra Pradesh, India. User asks: {user_query}. Provide helpful tourism information about Andhra Pradesh including temples, beaches, food, and attractions. Respond in {language}."
+
+
+def legacy_itinerary(user_request: str, duration: int, language: str) -> str:
+    itinerary_prompt = f"""
+            Create a detailed {duration}-day travel itinerary for Andhra Pradesh based on this request: "{user_request}"
+
+            REQUIREMENTS:
+            - Focus primarily on major cities and attractions in Andhra Pradesh
+            - Include practical details: timings, approximate costs, transportation
+            - Mix of cultural, historical, spiritual, and local experiences
+            - Include local food recommendations for each day
+            - Suggest authentic local experiences
+            - Consider travel time between locations
+            - Include rest periods and meal times
+
+            FORMAT THE RESPONSE AS HTML WITH THESE ELEMENTS:
+            - Use <h3> for day headers (Day 1, Day 2, etc.)
+            - Use <div class="day-item"> for each day's content
+            - Use <strong> for time slots and important places
+            - Use <br> for line breaks
+            - Include emojis for visual appeal
+            - Use bullet points with • for activities
+
+            SAMPLE STRUCTURE:
+            <h3>🗓️ Day 1: Arrival & Visakhapatnam Exploration</h3>
+            <div class="day-item">
+            <strong>9:00 AM</strong> - Arrival and hotel check-in<br>
+            <strong>10:30 AM</strong> - Visit Kailasagiri Hill Park 🏔️<br>
+            • Enjoy panoramic views of the city<br>
+            • Entry fee: ₹30 per person<br>
+            <strong>12:30 PM</strong> - Lunch at local Andhra restaurant<br>
+            • Try: Biryani, Pulihora, Andhra meals<br>
+            <strong>2:00 PM</strong> - RK Beach visit 🏖️<br>
+            <strong>Evening</strong> - Local market exploration<br>
+            </div>
+
+            Make it comprehensive, practical, and engaging for travelers!
+            Language: {language}
+            """
+    # The original code passed this through get_tourism_response, which wrapped it again
+    return legacy_tourism(itinerary_prompt, "English")
+
+
+def legacy_translation(chunk: str, target_lang: str) -> str:
+    return f"Translate the following text to {target_lang}. Only return the translated text without any additional text or explanations. Here's the text to translate: \"{chunk}\""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--per-1k-prompt-chars", type=float, default=0.02, help="fake prefill time per 1000 prompt chars (s)")
+    args = parser.parse_args()
+
+    trip = parse_trip_request(TRIP_REQUEST)
+    routes = {
+        "tourism": (legacy_tourism(QUERY, "Telugu"), {"query": QUERY, "language": "Telugu"}),
+        "itinerary": (legacy_itinerary(TRIP_REQUEST, trip.duration_days, "English"),
+                      {"duration": trip.duration_days, "trip": trip.describe(), "language": "English"}),
+        "translation": (legacy_translation(CHUNK, "Hindi"), {"language": "Hindi", "text": CHUNK}),
+    }
+    profile = LatencyProfile(base_s=0.01, per_1k_prompt_chars_s=args.per_1k_prompt_chars)
+
+    print(f"{'route':<12} {'template':<15} {'before chars':>12} {'after content':>13} "
+          f"{'after system':>12} {'before ms':>10} {'after ms':>9}")
+    for route, (legacy_prompt, slots) in routes.items():
+        template = get_prompt(route)
+        content = template.render(**slots)
+
+        backend = FakeGenAIClient(default_profile=profile)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            backend.models.generate_content(model="gemini-1.5-pro", contents=legacy_prompt)
+        before_ms = (time.perf_counter() - start) * 1000 / args.repeat
+
+        backend = FakeGenAIClient(default_profile=profile)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            # A fresh cache each time so every call reaches the backend
+            GeminiClient(client=backend, store=MemoryStore()).generate(route, **slots)
+        after_ms = (time.perf_counter() - start) * 1000 / args.repeat
+
+        print(f"{route:<12} {template.cache_tag:<15} {len(legacy_prompt):>12} {len(content):>13} "
+              f"{len(template.system_instruction):>12} {before_ms:>10.1f} {after_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
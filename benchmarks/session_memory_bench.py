@@ -0,0 +1,98 @@
+"""
+Resident memory per 1000 chat sessions, dict messages vs MessageHistory.
+
+Each session is loaded from its persisted JSON form (as happens when a
+worker resumes it from the shared store) and holds a few itineraries and
+short answers. Each variant runs in a fresh subprocess so RSS deltas are
+not polluted by the other.
+
+    python benchmarks/session_memory_bench.py --sessions 1000 --turns 10
+"""
+import sys
+import json
+import random
+import argparse
+import subprocess
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.message_store import MessageHistory
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * 4096
+
+
+def make_itinerary(rng: random.Random, days: int) -> str:
+    places = ["Tirupati", "Visakhapatnam", "Araku Valley", "Vijayawada", "Srisailam", "Horsley Hills"]
+    body = "".join(
+        f"<h3>🗓️ Day {day}: {rng.choice(places)}</h3>\n<div class=\"day-item\">\n"
+        f"<strong>9:00 AM</strong> - Temple darshan and breakfast<br>\n"
+        f"• Entry fee: ₹{rng.randint(10, 300)} per person<br>\n"
+        f"<strong>1:00 PM</strong> - Andhra meals at a local restaurant<br>\n"
+        f"<strong>Evening</strong> - Beach walk and local market exploration<br>\n</div>\n"
+        for day in range(1, days + 1)
+    )
+    return f"<h2>🗺️ Your Personalized Andhra Pradesh Travel Itinerary</h2>\n{body}<hr>\n<p>💡 Pro Tips ...</p>"
+
+
+def make_session(rng: random.Random, turns: int, shared_answers: list) -> str:
+    messages = []
+    for turn in range(turns):
+        messages.append({"role": "user", "content": f"Question {rng.randint(0, 10**6)} about Andhra Pradesh"})
+        if turn % 3 == 2:
+            text = make_itinerary(rng, rng.randint(3, 7))
+            messages.append({"role": "assistant", "content": text, "type": "itinerary", "original_content": text})
+        else:
+            text = rng.choice(shared_answers)
+            messages.append({"role": "assistant", "content": text, "original_content": text})
+    return json.dumps(messages, ensure_ascii=False)
+
+
+def measure(variant: str, sessions: int, turns: int, max_bytes: int) -> int:
+    rng = random.Random(1)
+    shared_answers = [make_itinerary(random.Random(i), 1) * 2 for i in range(20)]
+    baseline = rss_bytes()
+    held = []
+    for _ in range(sessions):
+        messages = json.loads(make_session(rng, turns, shared_answers))
+        if variant == "compact":
+            history = MessageHistory(max_bytes=max_bytes)
+            for data in messages:
+                history.append(data["role"], data["content"], data.get("type", ""), data.get("original_content"))
+            held.append(history)
+        else:
+            held.append(messages)
+    return rss_bytes() - baseline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--max-bytes", type=int, default=64 * 1024)
+    parser.add_argument("--variant", choices=["dict", "compact"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(measure(args.variant, args.sessions, args.turns, args.max_bytes))
+        return
+
+    results = {}
+    for variant in ("dict", "compact"):
+        output = subprocess.check_output([
+            sys.executable, __file__, "--variant", variant, "--sessions", str(args.sessions),
+            "--turns", str(args.turns), "--max-bytes", str(args.max_bytes)
+        ])
+        results[variant] = int(output.decode().strip().splitlines()[-1])
+    per_1000 = {variant: delta * 1000 / args.sessions / 2**20 for variant, delta in results.items()}
+    print(f"{'variant':<8} {'MiB per 1000 sessions':>22}")
+    for variant, mib in per_1000.items():
+        print(f"{variant:<8} {mib:>22.1f}")
+    print(f"reduction: {1 - per_1000['compact'] / per_1000['dict']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Cache hit rate and latency against worker count.
+
+Simulates N Streamlit worker processes behind a load balancer answering a
+Zipf-distributed stream of tourism questions on the fake backend, once with
+a per-process MemoryStore and once with a shared SQLite (WAL) store.
+
+    python benchmarks/shared_cache_bench.py --workers 1 2 4 8
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.fake_backend import FakeGenAIClient, LatencyProfile
+from utils.gemini_client import GeminiClient
+from utils.stats import percentile
+from utils.storage import MemoryStore, SQLiteStore
+
+
+def build_workload(requests: int, distinct: int, seed: int) -> list:
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, distinct + 1)]
+    return rng.choices(range(distinct), weights=weights, k=requests)
+
+
+def run_worker(args) -> list:
+    queries, store_path, latency_s = args
+    store = SQLiteStore(store_path) if store_path else MemoryStore()
+    client = GeminiClient(
+        client=FakeGenAIClient(default_profile=LatencyProfile(base_s=latency_s)),
+        store=store
+    )
+    results = []
+    for query_id in queries:
+        hits_before = client.response_cache.hits
+        start = time.perf_counter()
+        client.get_tourism_response(f"Popular question #{query_id} about Andhra Pradesh")
+        results.append((client.response_cache.hits > hits_before, time.perf_counter() - start))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--requests", type=int, default=800)
+    parser.add_argument("--distinct", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02, help="fake backend latency in seconds")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    workload = build_workload(args.requests, args.distinct, args.seed)
+    print(f"{'backend':<8} {'workers':>7} {'hit rate':>9} {'mean ms':>8} {'p95 ms':>8}")
+    for backend in ("memory", "sqlite"):
+        for workers in args.workers:
+            with tempfile.TemporaryDirectory() as tmp:
+                store_path = os.path.join(tmp, "store.sqlite3") if backend == "sqlite" else None
+                if store_path:
+                    SQLiteStore(store_path)  # create the schema before workers race for it
+                # Round-robin load balancing: request i goes to worker i % workers
+                shards = [(workload[i::workers], store_path, args.latency) for i in range(workers)]
+                with multiprocessing.Pool(workers) as pool:
+                    results = [item for shard in pool.map(run_worker, shards) for item in shard]
+            hit_rate = sum(hit for hit, _ in results) / len(results)
+            latencies = [latency * 1000 for _, latency in results]
+            print(f"{backend:<8} {workers:>7} {hit_rate:>9.1%} "
+                  f"{sum(latencies) / len(latencies):>8.2f} {percentile(latencies, 95):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Hit rate of speculative background translation on language switches.
+
+Simulated sessions ask questions through admission control, read each
+answer for a while, and sometimes switch language, at which point every
+earlier answer in another language needs a translation. Without
+speculation the switch blocks on translating the history. With it, each
+answer was queued for the other languages as soon as it was shown, and the
+switch only looks the translations up in the cache.
+
+    python benchmarks/speculative_translation_bench.py --sessions 20
+"""
+import sys
+import time
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.admission import ADMITTED, ANSWER, AdmissionController
+from utils.fake_backend import FakeGenAIClient, LatencyProfile
+from utils.gemini_client import GeminiClient
+from utils.model_router import ModelRouter
+from utils.speculative_translation import SpeculativeTranslator
+from utils.stats import percentile
+from utils.storage import MemoryStore
+
+LANGUAGES = ["English", "Hindi", "Telugu"]
+
+
+def run(speculate: bool, args) -> dict:
+    backend = FakeGenAIClient(default_profile=LatencyProfile(base_s=args.latency, jitter_s=args.latency / 2),
+                              max_concurrency=args.capacity)
+    client = GeminiClient(client=backend, store=MemoryStore(), router=ModelRouter(hedging=False))
+    controller = AdmissionController(max_in_flight=args.capacity, session_rate=10, session_burst=10)
+    pool = ThreadPoolExecutor(max_workers=16)
+    translator = SpeculativeTranslator(client, LANGUAGES, admission=controller, pool=pool) if speculate else None
+    switch_latencies = []
+    lock = threading.Lock()
+
+    def session(index: int):
+        rng = random.Random(index)
+        language = rng.choice(LANGUAGES)
+        history = []
+        for turn in range(args.turns):
+            with controller.admit(f"session-{index}", ANSWER) as decision:
+                query = f"Question {index}-{turn}"
+                if decision == ADMITTED:
+                    answer = client.get_tourism_response(query, language)
+                else:
+                    answer = client.get_degraded_response(query, language)
+            history.append((answer, language))
+            if translator:
+                translator.submit(answer, language)
+
+            time.sleep(rng.uniform(0.5, 1.5) * args.think)
+            if rng.random() < args.switch_prob:
+                language = rng.choice([other for other in LANGUAGES if other != language])
+                start = time.perf_counter()
+                for content, source in history:
+                    if translator:
+                        translator.lookup(content, source, language)
+                    else:
+                        client.translate(content, language, source_language=source)
+                with lock:
+                    switch_latencies.append(time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=args.sessions) as sessions:
+        list(sessions.map(session, range(args.sessions)))
+
+    latencies_ms = [latency * 1000 for latency in switch_latencies] or [0.0]
+    metrics = translator.metrics() if translator else {}
+    return {
+        "switches": len(switch_latencies),
+        "p50": percentile(latencies_ms, 50),
+        "p95": percentile(latencies_ms, 95),
+        "hit_rate": metrics.get("hit_rate", 0.0),
+        "translated": metrics.get("translated", 0),
+        "paused": metrics.get("paused", 0),
+        "calls": len(backend.calls),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=4)
+    parser.add_argument("--think", type=float, default=1.0, help="mean seconds a user reads each answer")
+    parser.add_argument("--switch-prob", type=float, default=0.3, help="chance of a language switch after each answer")
+    parser.add_argument("--latency", type=float, default=0.15, help="fake backend latency (s)")
+    parser.add_argument("--capacity", type=int, default=8, help="concurrent requests the backend serves")
+    args = parser.parse_args()
+
+    print(f"{'speculation':<11} {'switches':>8} {'p50 ms':>7} {'p95 ms':>7} {'hit rate':>8} "
+          f"{'bg translated':>13} {'paused':>6} {'calls':>6}")
+    for speculate in (False, True):
+        result = run(speculate, args)
+        print(f"{'on' if speculate else 'off':<11} {result['switches']:>8} {result['p50']:>7.0f} {result['p95']:>7.0f} "
+              f"{result['hit_rate']:>8.1%} {result['translated']:>13} {result['paused']:>6} {result['calls']:>6}")
+
+
+if __name__ == "__main__":
+    main()
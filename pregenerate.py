@@ -0,0 +1,229 @@
+"""
+Pre-generate answers and itineraries for popular requests into the shared store.
+
+Every question and itinerary request in the spec file is run for every
+language through the same GeminiClient / ItineraryGenerator code paths the
+app uses, so the results land under the exact cache keys the app looks up
+and the head of the traffic distribution is served without live calls.
+
+The spec is a JSON object:
+
+    {
+      "languages": ["English", "Hindi", "Telugu"],
+      "queries": ["Tell me about famous temples in Andhra Pradesh"],
+      "itineraries": ["Help me plan a 3-day trip to Andhra Pradesh"],
+      "itinerary_grid": {"days": [1, 2, 3], "cities": ["Tirupati", "Vizag"]}
+    }
+
+Queries and itinerary requests are written in English. For other
+languages they are translated the way the app translates its quick actions
+before being asked, since the translated wording is what a Hindi or Telugu
+user sends. `itinerary_grid` expands to "Plan a {days}-day trip to {city}"
+requests.
+
+Completed jobs are appended to a checkpoint file, so an interrupted run
+resumes where it stopped. A checkpointed job is only skipped while its
+result is still in the store: cached answers and itineraries expire (24h
+by default), so rerunning the CLI daily during peak season regenerates
+whatever expired. `--dry-run` uses the offline fake backend and an
+in-memory store, and reports throughput without touching the real cache.
+
+    python pregenerate.py pregenerate_spec.json --concurrency 4
+    python pregenerate.py pregenerate_spec.json --dry-run
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import List, Optional, Set
+
+from utils.gemini_client import GeminiClient
+from utils.itinerary_generator import ItineraryGenerator
+from utils.model_router import ModelRouter
+from utils.stats import percentile
+from utils.storage import MemoryStore, create_store, get_store
+
+ANSWER = "answer"
+ITINERARY = "itinerary"
+
+
+@dataclass(frozen=True)
+class Job:
+    kind: str
+    text: str
+    language: str
+
+    @property
+    def id(self) -> str:
+        return json.dumps([self.kind, self.language, self.text], ensure_ascii=False)
+
+
+def load_jobs(spec_path: str) -> List[Job]:
+    """Expand a spec file into one job per request and language."""
+    with open(spec_path, encoding="utf-8") as spec_file:
+        spec = json.load(spec_file)
+
+    itineraries = list(spec.get("itineraries", []))
+    grid = spec.get("itinerary_grid")
+    if grid:
+        itineraries += [f"Plan a {days}-day trip to {city}" for city in grid["cities"] for days in grid["days"]]
+
+    jobs = []
+    for language in spec.get("languages", ["English"]):
+        jobs += [Job(ANSWER, query, language) for query in spec.get("queries", [])]
+        jobs += [Job(ITINERARY, request, language) for request in itineraries]
+    return jobs
+
+
+def load_checkpoint(path: str) -> Set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as checkpoint:
+        return {line.rstrip("\n") for line in checkpoint if line.strip()}
+
+
+class Pregenerator:
+    """
+    Runs jobs the way app.py would serve them, so results are cache hits later.
+
+    Itineraries follow the same SAANCHARI_ITINERARY_MODE and
+    SAANCHARI_LOCALIZATION_MODE settings as the app: in "translate" mode the
+    English itinerary and its translation are cached, in "direct" mode the
+    localized itinerary itself.
+    """
+
+    def __init__(self, client: GeminiClient, itinerary_mode: str, localization_mode: str):
+        self.client = client
+        self.generator = ItineraryGenerator(client)
+        self.itinerary_mode = itinerary_mode
+        self.localization_mode = localization_mode
+
+    def _request(self, job: Job, cache_only: bool = False) -> Optional[str]:
+        # What a user of job.language sends: the app's quick actions are translated UI text
+        return self.client.translate(job.text, job.language, route="ui_translation", cache_only=cache_only)
+
+    def is_cached(self, job: Job) -> bool:
+        """Whether the app would currently serve this job from the cache."""
+        request = self._request(job, cache_only=True)
+        if request is None:
+            return False
+        if job.kind == ANSWER:
+            return self.client.get_cached_response(request, job.language) is not None
+
+        if job.language != "English" and self.localization_mode == "direct":
+            return self.generator.get_cached_itinerary(request, job.language) is not None
+
+        itinerary = self.generator.get_cached_itinerary(request, "English")
+        if itinerary is None or job.language == "English":
+            return itinerary is not None
+        return self.client.translate(itinerary, job.language, cache_only=True) is not None
+
+    def run(self, job: Job) -> bool:
+        """
+        Generate and cache one job.
+
+        Returns:
+            bool: True if the result is now cached, False if generation failed
+        """
+        request = self._request(job)
+        if job.kind == ANSWER:
+            self.client.get_tourism_response(request, job.language)
+            return self.client.get_cached_response(request, job.language) is not None
+
+        if job.language != "English" and self.localization_mode == "direct":
+            self.generator.generate_localized_itinerary(request, job.language)
+            return self.generator.get_cached_itinerary(request, job.language) is not None
+
+        # Like the app, the English itinerary is generated from the user's own wording
+        if self.itinerary_mode == "parallel":
+            itinerary = self.generator.generate_itinerary_parallel(request, "English")
+        else:
+            itinerary = self.generator.generate_itinerary(request, "English")
+        if self.generator.get_cached_itinerary(request, "English") is None:
+            return False
+        if job.language == "English":
+            return True
+        self.client.translate(itinerary, job.language)
+        return self.client.translate(itinerary, job.language, cache_only=True) is not None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("spec", help="JSON spec of queries, itineraries and languages")
+    parser.add_argument("--concurrency", type=int, default=4, help="jobs generated at once")
+    parser.add_argument("--checkpoint", help="file of completed job ids (default: <spec>.done, none for dry runs)")
+    parser.add_argument("--store", help="store URL (default: SAANCHARI_STORE_URL)")
+    parser.add_argument("--itinerary-mode", default=os.getenv("SAANCHARI_ITINERARY_MODE", "parallel"))
+    parser.add_argument("--localization-mode", default=os.getenv("SAANCHARI_LOCALIZATION_MODE", "direct"))
+    parser.add_argument("--dry-run", action="store_true", help="use the fake backend and an in-memory store")
+    parser.add_argument("--fake-latency", type=float, default=0.2, help="fake backend latency in dry runs (s)")
+    args = parser.parse_args()
+
+    # Same tiers and routes as the app, so cache keys match; hedging would
+    # only double the cost of a batch run
+    router = ModelRouter.from_env()
+    router.hedging = False
+    if args.dry_run:
+        from utils.fake_backend import FakeGenAIClient, LatencyProfile
+        backend = FakeGenAIClient(default_profile=LatencyProfile(base_s=args.fake_latency))
+        client = GeminiClient(client=backend, store=MemoryStore(), router=router)
+        checkpoint_path = args.checkpoint
+    else:
+        store = create_store(args.store) if args.store else get_store()
+        client = GeminiClient(store=store, router=router)
+        checkpoint_path = args.checkpoint or f"{args.spec}.done"
+
+    jobs = load_jobs(args.spec)
+    done = load_checkpoint(checkpoint_path) if checkpoint_path else set()
+    pregenerator = Pregenerator(client, args.itinerary_mode, args.localization_mode)
+    # The checkpoint only proves a job ran once; its cache entry may have expired since
+    pending = [job for job in jobs if job.id not in done or not pregenerator.is_cached(job)]
+    print(f"{len(jobs)} jobs, {len(jobs) - len(pending)} already done and cached, {len(pending)} to run")
+
+    latencies = {ANSWER: [], ITINERARY: []}
+    failed = []
+    checkpoint_lock = threading.Lock()
+
+    def run_job(job: Job) -> tuple:
+        start = time.perf_counter()
+        try:
+            ok = pregenerator.run(job)
+        except Exception as e:
+            logging.error(f"Pre-generation failed for {job.id}: {str(e)}")
+            ok = False
+        if ok and checkpoint_path:
+            with checkpoint_lock, open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+                checkpoint.write(job.id + "\n")
+        return job, ok, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(run_job, job) for job in pending]
+        for index, future in enumerate(as_completed(futures), 1):
+            job, ok, elapsed = future.result()
+            latencies[job.kind].append(elapsed)
+            if not ok:
+                failed.append(job)
+            print(f"[{index}/{len(pending)}] {'ok  ' if ok else 'FAIL'} {elapsed:6.2f}s "
+                  f"{job.kind:<9} {job.language:<7} {job.text[:60]}", flush=True)
+    elapsed = time.perf_counter() - start
+
+    calls = sum(stats["calls"] + stats["errors"] for stats in router.stats().values())
+    print(f"\n{len(pending) - len(failed)} generated, {len(failed)} failed in {elapsed:.1f}s "
+          f"({len(pending) / elapsed if elapsed else 0:.2f} jobs/s, {calls} model calls, "
+          f"concurrency {args.concurrency})")
+    for kind, values in latencies.items():
+        if values:
+            print(f"    {kind:<9} n={len(values):<4} mean={sum(values) / len(values):.2f}s "
+                  f"p95={percentile(values, 95):.2f}s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
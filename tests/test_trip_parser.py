@@ -0,0 +1,72 @@
+import pytest
+
+from utils.trip_parser import DEFAULT_DURATION, MAX_DURATION_DAYS, parse_trip_request
+
+
+@pytest.mark.parametrize("request_text, days", [
+    ("Plan a 5-day trip to Araku", 5),
+    ("ఐదు రోజులు అరకు ప్రయాణం", 5),
+    ("पांच दिन की यात्रा", 5),
+    ("a fortnight in Andhra Pradesh", 14),
+    ("one week in Vizag", 7),
+    ("3 nights in Tirupati", 3),
+    ("Plan a weekend trip", 2),
+    ("Plan a long weekend trip to Vizag", 2),
+    ("a long trip to Vizag", 7),
+    ("Help me plan a trip", DEFAULT_DURATION),
+    ("Plan a 200-day trip", MAX_DURATION_DAYS),
+])
+def test_duration(request_text, days):
+    assert parse_trip_request(request_text).duration_days == days
+
+
+@pytest.mark.parametrize("request_text, budget", [
+    ("2 days in Vizag, rs 5000", "₹5,000"),
+    ("Rs. 8000 for 3 days", "₹8,000"),
+    ("₹20,000 trip", "₹20,000"),
+    ("budget of 15k rupees for 4 days", "₹15,000"),
+    ("cheap trip to Tirupati", "budget"),
+    ("trip for 2 travellers, 3 days in Vizag", None),
+    ("Suggest temple tours 2 days Tirupati", None),
+])
+def test_budget(request_text, budget):
+    assert parse_trip_request(request_text).budget == budget
+
+
+def test_count_is_not_taken_by_amount():
+    trip = parse_trip_request("Suggest temple tours 2 days Tirupati")
+    assert trip.duration_days == 2
+    assert trip.cities == ("Tirupati",)
+    assert trip.interests == ("temples",)
+
+
+def test_cities_across_scripts():
+    assert parse_trip_request("3 days in Vizag").cities == ("Visakhapatnam",)
+    assert parse_trip_request("విశాఖపట్నం 3 రోజులు").cities == ("Visakhapatnam",)
+    assert parse_trip_request("तिरुपति 2 दिन").cities == ("Tirupati",)
+
+
+def test_unknown_destination_kept_in_notes():
+    trip = parse_trip_request("Plan a 3-day trip to Maredumilli")
+    assert trip.cities == ()
+    assert trip.notes == "maredumilli"
+    assert "maredumilli" in trip.cache_key()
+
+
+def test_rewordings_share_cache_key():
+    assert (parse_trip_request("Plan a 3-day trip to Vizag").cache_key()
+            == parse_trip_request("Can you help me plan three days in Visakhapatnam please").cache_key())
+
+
+@pytest.mark.parametrize("request_text", [
+    "आंध्र प्रदेश की 3-दिन की यात्रा की योजना बनाने में मेरी मदद करें",
+    "ఆంధ్రప్రదేశ్‌కు 3 రోజుల పర్యటనను ప్లాన్ చేయడంలో నాకు సహాయం చేయండి",
+])
+def test_indic_plan_query_has_no_notes(request_text):
+    assert parse_trip_request(request_text).cache_key() == parse_trip_request("Plan a 3-day trip").cache_key()
+
+
+def test_telugu_case_endings_stay_with_the_city():
+    trip = parse_trip_request("విశాఖపట్నానికి 4 రోజుల యాత్రను ప్లాన్ చేయండి")
+    assert trip.cities == ("Visakhapatnam",)
+    assert trip.notes == ""
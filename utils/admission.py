@@ -0,0 +1,169 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+# Request kinds
+ANSWER = "answer"
+ITINERARY = "itinerary"
+
+# Admission decisions
+ADMITTED = "admitted"
+DEGRADED = "degraded"  # answer from cache or local fallback content
+SHED = "shed"          # refuse with a "busy" message
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def try_acquire(self, cost: float = 1.0) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return True
+        return False
+
+
+class AdmissionController:
+    """
+    Per-session and global admission control for backend work.
+
+    Every request first spends a token from its session's bucket, which stops
+    one user from flooding the backend with quick-action clicks. It then needs
+    one of `max_in_flight` global slots. When none is free it waits in a
+    bounded queue: answers may use at most half of the queue and give up
+    quickly, since they have a cheap degraded path (cache or local fallback
+    content); itineraries may wait longer but are shed once the queue is full.
+    """
+
+    def __init__(self, max_in_flight: int = 8, max_queue: int = 32,
+                 session_rate: float = 0.5, session_burst: float = 5,
+                 answer_timeout_s: float = 2.0, itinerary_timeout_s: float = 20.0,
+                 max_sessions: int = 10000):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.session_rate = session_rate
+        self.session_burst = session_burst
+        self.timeouts = {ANSWER: answer_timeout_s, ITINERARY: itinerary_timeout_s}
+        self.queue_limits = {ANSWER: max(1, max_queue // 2), ITINERARY: max_queue}
+        self.max_sessions = max_sessions
+
+        self.in_flight = 0
+        self.queued = 0
+        self.max_queue_seen = 0
+        self.counts: Dict[str, int] = {ADMITTED: 0, DEGRADED: 0, SHED: 0, "rate_limited": 0}
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        return cls(
+            max_in_flight=int(os.getenv("SAANCHARI_MAX_IN_FLIGHT", "8")),
+            max_queue=int(os.getenv("SAANCHARI_MAX_QUEUE", "32")),
+            session_rate=float(os.getenv("SAANCHARI_SESSION_RATE", "0.5")),
+            session_burst=float(os.getenv("SAANCHARI_SESSION_BURST", "5")),
+        )
+
+    def _rejected(self, kind: str) -> str:
+        decision = DEGRADED if kind == ANSWER else SHED
+        self.counts[decision] += 1
+        return decision
+
+    def _session_allows(self, session_id: str) -> bool:
+        bucket = self._buckets.get(session_id)
+        if bucket is None:
+            bucket = TokenBucket(self.session_rate, self.session_burst)
+            self._buckets[session_id] = bucket
+            if len(self._buckets) > self.max_sessions:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(session_id)
+        return bucket.try_acquire()
+
+    def acquire(self, session_id: str, kind: str = ANSWER) -> str:
+        """
+        Decide whether a request may call the backend, waiting for a slot if needed.
+
+        Returns:
+            str: ADMITTED (caller must call release()), DEGRADED or SHED
+        """
+        with self._cond:
+            if not self._session_allows(session_id):
+                self.counts["rate_limited"] += 1
+                return self._rejected(kind)
+
+            if self.in_flight < self.max_in_flight and not self.queued:
+                self.in_flight += 1
+                self.counts[ADMITTED] += 1
+                return ADMITTED
+
+            if self.queued >= self.queue_limits[kind]:
+                return self._rejected(kind)
+
+            self.queued += 1
+            self.max_queue_seen = max(self.max_queue_seen, self.queued)
+            deadline = time.monotonic() + self.timeouts[kind]
+            try:
+                while self.in_flight >= self.max_in_flight:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return self._rejected(kind)
+                    self._cond.wait(remaining)
+            finally:
+                self.queued -= 1
+            self.in_flight += 1
+            self.counts[ADMITTED] += 1
+            return ADMITTED
+
+    def release(self) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def admit(self, session_id: str, kind: str = ANSWER) -> Iterator[str]:
+        """Context manager around acquire()/release() yielding the decision."""
+        decision = self.acquire(session_id, kind)
+        try:
+            yield decision
+        finally:
+            if decision == ADMITTED:
+                self.release()
+
+    def metrics(self) -> dict:
+        with self._cond:
+            total = sum(self.counts[decision] for decision in (ADMITTED, DEGRADED, SHED))
+            return {
+                "in_flight": self.in_flight,
+                "queue_depth": self.queued,
+                "max_queue_depth": self.max_queue_seen,
+                "admitted": self.counts[ADMITTED],
+                "degraded": self.counts[DEGRADED],
+                "shed": self.counts[SHED],
+                "rate_limited": self.counts["rate_limited"],
+                "degraded_rate": self.counts[DEGRADED] / total if total else 0.0,
+            }
+
+
+_controller = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Return the process-wide controller shared by every Streamlit session."""
+    global _controller
+    if _controller is None:
+        with _controller_lock:
+            if _controller is None:
+                _controller = AdmissionController.from_env()
+    return _controller
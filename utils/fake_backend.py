@@ -0,0 +1,158 @@
+import re
+import time
+import random
+import threading
+from typing import Dict, List, Optional
+from .glossary import GLOSSARY
+
+
+LOCALIZED_DAY = {
+    "Hindi": ("<h3>🗓️ दिन {day}: विशाखापत्तनम</h3>\n<div class=\"day-item\">\n"
+              "<strong>9:00 AM</strong> - कैलासगिरि पहाड़ी पार्क की सैर 🏔️<br>\n"
+              "• प्रवेश शुल्क: ₹30 प्रति व्यक्ति<br>\n"
+              "<strong>2:00 PM</strong> - आरके बीच 🏖️<br>\n</div>"),
+    "Telugu": ("<h3>🗓️ రోజు {day}: విశాఖపట్నం</h3>\n<div class=\"day-item\">\n"
+               "<strong>9:00 AM</strong> - కైలాసగిరి కొండ పార్క్ సందర్శన 🏔️<br>\n"
+               "• ప్రవేశ రుసుము: ₹30 ఒక్కొక్కరికి<br>\n"
+               "<strong>2:00 PM</strong> - ఆర్కే బీచ్ 🏖️<br>\n</div>"),
+}
+
+
+class LatencyProfile:
+    """
+    Simulated response time: a fixed base, a per-character cost for the
+    prompt (prefill) and for the output (decode), plus random jitter. With
+    probability `tail_prob` an extra `tail_s` is added to model slow outliers.
+    """
+
+    def __init__(self, base_s: float = 0.05, per_1k_chars_s: float = 0.0, jitter_s: float = 0.0,
+                 per_1k_prompt_chars_s: float = 0.0, tail_prob: float = 0.0, tail_s: float = 0.0):
+        self.base_s = base_s
+        self.per_1k_chars_s = per_1k_chars_s
+        self.per_1k_prompt_chars_s = per_1k_prompt_chars_s
+        self.jitter_s = jitter_s
+        self.tail_prob = tail_prob
+        self.tail_s = tail_s
+
+    def sample(self, output_chars: int, rng: random.Random, prompt_chars: int = 0) -> float:
+        jitter = rng.uniform(0, self.jitter_s) if self.jitter_s else 0.0
+        tail = self.tail_s if self.tail_prob and rng.random() < self.tail_prob else 0.0
+        return (self.base_s + self.per_1k_chars_s * output_chars / 1000
+                + self.per_1k_prompt_chars_s * prompt_chars / 1000 + jitter + tail)
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _FakeModels:
+    def __init__(self, backend: "FakeGenAIClient"):
+        self._backend = backend
+
+    def generate_content(self, model: str, contents, config=None) -> FakeResponse:
+        return self._backend._generate(model, contents, config)
+
+
+class FakeGenAIClient:
+    """
+    Offline stand-in for `google.genai.Client` used by benchmarks and dry runs.
+
+    Mirrors the `client.models.generate_content(model=..., contents=..., config=...)`
+    call shape, sleeps according to a per-model LatencyProfile and returns
+    deterministic text. Every call is recorded so callers can report call
+    counts and prompt sizes.
+
+    With `name_fidelity` set, translations render each glossary term in its
+    approved form only with that probability and leave it in English
+    otherwise, like a model that handles names inconsistently.
+    """
+
+    def __init__(self, profiles: Optional[Dict[str, LatencyProfile]] = None,
+                 default_profile: Optional[LatencyProfile] = None, seed: int = 0,
+                 max_concurrency: Optional[int] = None, name_fidelity: Optional[float] = None):
+        self.profiles = profiles or {}
+        self.name_fidelity = name_fidelity
+        # Server-side capacity: requests beyond it wait for a free slot
+        self._capacity = threading.Semaphore(max_concurrency) if max_concurrency else None
+        self.default_profile = default_profile or LatencyProfile()
+        self.models = _FakeModels(self)
+        self.calls: List[dict] = []
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _generate(self, model: str, contents, config=None) -> FakeResponse:
+        prompt = contents if isinstance(contents, str) else str(contents)
+        system = getattr(config, "system_instruction", None) or ""
+        text = self._respond(prompt)
+        profile = self.profiles.get(model, self.default_profile)
+        with self._lock:
+            delay = profile.sample(len(text), self._rng, len(prompt) + len(system))
+            self.calls.append({
+                "model": model,
+                "prompt_chars": len(prompt),
+                "system_chars": len(system),
+                "output_chars": len(text),
+                "latency_s": delay,
+            })
+        if self._capacity is None:
+            time.sleep(delay)
+        else:
+            with self._capacity:
+                time.sleep(delay)
+        return FakeResponse(text)
+
+    def _render_names(self, text: str, language: str) -> str:
+        terms = "|".join(re.escape(term) for term in sorted(GLOSSARY, key=len, reverse=True))
+
+        def render(match) -> str:
+            with self._lock:
+                faithful = self._rng.random() < self.name_fidelity
+            return GLOSSARY[match.group(0)].get(language, match.group(0)) if faithful else match.group(0)
+
+        return re.sub(r"(?<!\w)(?:" + terms + r")(?!\w)", render, text)
+
+    def _respond(self, prompt: str) -> str:
+        translate = re.match(r'\s*Translate the following text to (\w+)', prompt)
+        if translate:
+            body = prompt.split("Here's the text to translate:", 1)[-1].strip().strip('"')
+            if self.name_fidelity is not None:
+                body = self._render_names(body, translate.group(1))
+            return f"[{translate.group(1)}] {body}"
+
+        route = re.search(r'ROUTE PLAN:.*?a (\d+) day trip', prompt)
+        if route:
+            cities = ["Tirupati", "Visakhapatnam", "Araku Valley", "Vijayawada", "Srisailam"]
+            return "\n".join(f"Day {day}: {cities[(day - 1) % len(cities)]}"
+                             for day in range(1, int(route.group(1)) + 1))
+
+        day_details = re.search(r'DAY DETAILS: Write Day (\d+) of \d+ .*?spent in (.+?)\. Trip:', prompt)
+        if day_details:
+            day, city = day_details.groups()
+            return (f"Day {day}: Exploring {city}\n"
+                    f"9:00 AM - Breakfast and temple visit\n"
+                    f"- Entry fee: ₹30 per person\n"
+                    f"12:30 PM - Lunch at local Andhra restaurant\n"
+                    f"- Try: Biryani, Pulihora, Andhra meals\n"
+                    f"4:00 PM - Sightseeing and local market exploration")
+
+        localized = re.search(r'(\d+)-day .*?Write it in (\w+)', prompt, re.DOTALL)
+        if localized and localized.group(2) in LOCALIZED_DAY:
+            template = LOCALIZED_DAY[localized.group(2)]
+            return "\n".join(template.format(day=day) for day in range(1, int(localized.group(1)) + 1))
+
+        days = re.search(r'(\d+)-day', prompt)
+        if days:
+            return "\n".join(
+                f"<h3>🗓️ Day {day}: Visakhapatnam</h3>\n<div class=\"day-item\">\n"
+                f"<strong>9:00 AM</strong> - Visit Kailasagiri Hill Park 🏔️<br>\n"
+                f"• Entry fee: ₹30 per person<br>\n"
+                f"<strong>2:00 PM</strong> - RK Beach visit 🏖️<br>\n</div>"
+                for day in range(1, int(days.group(1)) + 1)
+            )
+
+        return f"Andhra Pradesh travel tip for: {prompt[:80]}"
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
@@ -1,17 +1,175 @@
 import os
+import re
 import logging
+from typing import Optional
 from google import genai
 from google.genai import types
+from .glossary import translate_protected
+from .model_router import get_router
+from .prompts import get_prompt
+from .storage import ResponseCache, get_store
+
+# Questions up to this length are answered by the "short_qa" route
+SHORT_QUERY_CHARS = 160
+
+# Texts longer than this are translated in chunks to stay within token limits
+TRANSLATION_CHUNK_CHARS = 1000
 
 class GeminiClient:
-    def __init__(self):
-        """Initialize Gemini client with API key from environment variables."""
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY environment variable is required")
-        
-        self.client = genai.Client(api_key=api_key)
-        self.model = "gemini-1.5-pro"
+    def __init__(self, client=None, store=None, router=None):
+        """
+        Initialize Gemini client with API key from environment variables.
+        
+        Args:
+            client: Optional pre-built client exposing `models.generate_content`
+                (e.g. FakeGenAIClient). If not provided, a genai.Client is created.
+            store: Optional key-value store for the response cache. Defaults to
+                the shared store configured by SAANCHARI_STORE_URL.
+            router: Optional ModelRouter mapping routes to model tiers. Defaults
+                to the process-wide router configured from the environment.
+        """
+        if client is None:
+            api_key = os.getenv("GEMINI_API_KEY")
+            if not api_key:
+                raise ValueError("GEMINI_API_KEY environment variable is required")
+            client = genai.Client(api_key=api_key)
+        
+        self.client = client
+        self.router = router if router is not None else get_router()
+        self.model = self.router.model_for("tourism")
+        self.response_cache = ResponseCache(store if store is not None else get_store(), "llm", ttl=24 * 3600)
+        # Whole-text translations, shared with every worker through the same store
+        self.translation_cache = ResponseCache(self.response_cache.store, "translation", ttl=30 * 24 * 3600)
+    
+    def generate(self, template_name: str, route: Optional[str] = None, cache_only: bool = False, **slots) -> Optional[str]:
+        """
+        Generate content from a registered prompt template.
+        
+        The template's fixed instructions are sent as the system instruction and
+        only the rendered slots as content. The route picks the model tier (and
+        hedging) through the ModelRouter. Responses are cached under the
+        template version, route model and content. A hedged fast-tier answer is
+        returned but not cached; the primary's answer is cached when it
+        arrives, so the next lookup still hits.
+        
+        Args:
+            template_name (str): Name of a template in utils.prompts
+            route (str): Optional route overriding the template's default route
+            cache_only (bool): Only look in the cache, never call the API
+            **slots: Values for the template's content slots
+            
+        Returns:
+            Optional[str]: Generated text, or None if the API returned nothing
+        """
+        template = get_prompt(template_name)
+        contents = template.render(**slots)
+        route = route or template.route
+        
+        cache_key = self.response_cache.key(template.cache_tag, self.router.model_for(route), contents)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None or cache_only:
+            return cached
+        
+        config = types.GenerateContentConfig(
+            system_instruction=template.system_instruction,
+            temperature=template.temperature,
+            max_output_tokens=template.max_output_tokens
+        )
+        def cache_late_primary(late_response):
+            if late_response and late_response.text:
+                self.response_cache.set(cache_key, late_response.text.strip())
+        
+        response, answered_by = self.router.call_with_model(route, lambda model: self.client.models.generate_content(
+            model=model,
+            contents=contents,
+            config=config
+        ), on_late_result=cache_late_primary)
+        
+        if response and response.text:
+            text = response.text.strip()
+            # Lookups use the primary's key, which must never hold fast-tier output
+            if answered_by == self.router.model_for(route):
+                self.response_cache.set(cache_key, text)
+            return text
+        return None
+    
+    def translate(self, text: str, language: str, route: str = "chunk_translation",
+                  cache_only: bool = False, source_language: str = "English") -> Optional[str]:
+        """
+        Translate text chunk by chunk, with glossary terms protected in English sources.
+        
+        Chunks that fail keep their original text, and only complete
+        translations are cached so a transient failure is retried next time.
+        
+        Args:
+            text (str): Text to translate
+            language (str): Target language name
+            route (str): Route selecting the model tier
+            cache_only (bool): Only look in the translation cache, never call the API
+            source_language (str): Language the text is written in
+            
+        Returns:
+            Optional[str]: Translated text; None only when cache_only misses
+        """
+        if not isinstance(text, str):
+            raise TypeError(f"translate() expects a string, got {type(text).__name__}")
+        if not text or language == source_language:
+            return text
+        
+        tag = get_prompt("translation").cache_tag
+        if source_language == "English":
+            cache_key = self.translation_cache.key(tag, language, text)
+        else:
+            cache_key = self.translation_cache.key(tag, source_language, language, text)
+        cached = self.translation_cache.get(cache_key)
+        if cached is not None or cache_only:
+            return cached
+        
+        chunks = self._split_into_chunks(text)
+        translated_chunks = []
+        all_translated = True
+        for chunk in chunks:
+            try:
+                # Glossary terms, numbers, prices and times are masked before the
+                # call and restored afterwards; instructions go in the "translation"
+                # template's system instruction
+                if source_language == "English":
+                    translated_chunk = translate_protected(
+                        chunk, language,
+                        lambda masked: self.generate("translation", route=route, language=language, text=masked)
+                    )
+                else:
+                    translated_chunk = self.generate("translation", route=route, language=language, text=chunk)
+            except Exception as e:
+                logging.error(f"Error translating chunk: {str(e)}")
+                translated_chunk = None
+            if not translated_chunk:
+                all_translated = False
+            translated_chunks.append(translated_chunk or chunk)
+        
+        translated = " ".join(translated_chunks)
+        if all_translated:
+            self.translation_cache.set(cache_key, translated)
+        return translated
+    
+    def _split_into_chunks(self, text: str, max_length: int = TRANSLATION_CHUNK_CHARS) -> list:
+        """Split text into chunks of maximum length, trying to split at sentence boundaries."""
+        if len(text) <= max_length:
+            return [text]
+        
+        sentences = re.split(r'(?<=[.!?])\s+', text)
+        chunks = []
+        current_chunk = ""
+        for sentence in sentences:
+            if len(current_chunk) + len(sentence) + 1 <= max_length:
+                current_chunk += (sentence + " ")
+            else:
+                if current_chunk:
+                    chunks.append(current_chunk.strip())
+                current_chunk = sentence + " "
+        if current_chunk:
+            chunks.append(current_chunk.strip())
+        return chunks
     
     def get_tourism_response(self, user_query: str, language: str = "English") -> str:
         """
@@ -25,16 +183,11 @@ class GeminiClient:
             str: AI-generated response about tourism
         """
         try:
-            # Simple, focused prompt
-            prompt = f"You are a tourism guide for Andhra Pradesh, India. User asks: {user_query}. Provide helpful tourism information about Andhra Pradesh including temples, beaches, food, and attractions. Respond in {language}."
+            route = "short_qa" if len(user_query) <= SHORT_QUERY_CHARS else "tourism"
+            response = self.generate("tourism", route=route, query=user_query, language=language)
             
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=prompt
-            )
-            
-            if response and response.text:
-                return response.text.strip()
+            if response:
+                return response
             else:
                 return self._get_fallback_response(user_query, language)
                 
@@ -42,6 +195,24 @@ class GeminiClient:
             logging.error(f"Error in get_tourism_response: {str(e)}")
             return self._get_fallback_response(user_query, language)
     
+    def get_degraded_response(self, user_query: str, language: str = "English") -> str:
+        """
+        Answer without calling the API, for use under overload.
+        
+        Returns a cached answer for the same question if there is one, otherwise
+        the local fallback content.
+        """
+        return self.get_cached_response(user_query, language) or self._get_fallback_response(user_query, language)
+    
+    def get_cached_response(self, user_query: str, language: str = "English") -> Optional[str]:
+        """Return the cached get_tourism_response answer for this question, if any."""
+        route = "short_qa" if len(user_query) <= SHORT_QUERY_CHARS else "tourism"
+        try:
+            return self.generate("tourism", route=route, cache_only=True, query=user_query, language=language)
+        except Exception as e:
+            logging.error(f"Error reading cached response: {str(e)}")
+            return None
+    
     def _get_fallback_response(self, user_query: str, language: str) -> str:
         """Provide fallback responses when API fails"""
         query_lower = user_query.lower()
@@ -204,7 +375,7 @@ Ask me about specific places, food, or say 'plan my trip' for detailed itinerari
         """
         try:
             config = types.GenerateContentConfig(
-                system_instruction=self.system_prompt,
+                system_instruction=get_prompt("tourism").system_instruction,
                 temperature=0.5,
                 max_output_tokens=1000
             )
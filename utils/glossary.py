@@ -0,0 +1,203 @@
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Approved Hindi/Telugu forms of place names, keyed by the English form
+PLACE_GLOSSARY: Dict[str, Dict[str, str]] = {
+    "Andhra Pradesh": {"Hindi": "आंध्र प्रदेश", "Telugu": "ఆంధ్ర ప్రదేశ్"},
+    "Tirupati": {"Hindi": "तिरुपति", "Telugu": "తిరుపతి"},
+    "Tirumala": {"Hindi": "तिरुमला", "Telugu": "తిరుమల"},
+    "Visakhapatnam": {"Hindi": "विशाखापत्तनम", "Telugu": "విశాఖపట్నం"},
+    "Vizag": {"Hindi": "विजाग", "Telugu": "వైజాగ్"},
+    "Araku Valley": {"Hindi": "अराकू घाटी", "Telugu": "అరకు లోయ"},
+    "Vijayawada": {"Hindi": "विजयवाड़ा", "Telugu": "విజయవాడ"},
+    "Srisailam": {"Hindi": "श्रीशैलम", "Telugu": "శ్రీశైలం"},
+    "Amaravati": {"Hindi": "अमरावती", "Telugu": "అమరావతి"},
+    "Horsley Hills": {"Hindi": "हॉर्सले हिल्स", "Telugu": "హార్సిలీ హిల్స్"},
+    "Rajahmundry": {"Hindi": "राजमुंदरी", "Telugu": "రాజమండ్రి"},
+    "Kailasagiri": {"Hindi": "कैलासगिरि", "Telugu": "కైలాసగిరి"},
+    "RK Beach": {"Hindi": "आरके बीच", "Telugu": "ఆర్కే బీచ్"},
+    "Rushikonda Beach": {"Hindi": "रुशिकोंडा बीच", "Telugu": "రుషికొండ బీచ్"},
+    "Kanaka Durga Temple": {"Hindi": "कनक दुर्गा मंदिर", "Telugu": "కనక దుర్గ ఆలయం"},
+    "Krishna River": {"Hindi": "कृष्णा नदी", "Telugu": "కృష్ణా నది"},
+    "Tirumala Balaji Temple": {"Hindi": "तिरुमला बालाजी मंदिर", "Telugu": "తిరుమల బాలాజీ ఆలయం"},
+    "Sri Venkateswara Temple": {"Hindi": "श्री वेंकटेश्वर मंदिर", "Telugu": "శ్రీ వేంకటేశ్వర ఆలయం"},
+    "Mallikarjuna Temple": {"Hindi": "मल्लिकार्जुन मंदिर", "Telugu": "మల్లికార్జున ఆలయం"},
+    "Borra Caves": {"Hindi": "बोर्रा गुफाएं", "Telugu": "బొర్రా గుహలు"},
+    "Undavalli Caves": {"Hindi": "उंडावल्ली गुफाएं", "Telugu": "ఉండవల్లి గుహలు"},
+    "Lepakshi": {"Hindi": "लेपाक्षी", "Telugu": "లేపాక్షి"},
+    "Gandikota": {"Hindi": "गंडिकोटा", "Telugu": "గండికోట"},
+    "Lambasingi": {"Hindi": "लंबसिंगी", "Telugu": "లంబసింగి"},
+    "Prakasam Barrage": {"Hindi": "प्रकाशम बैराज", "Telugu": "ప్రకాశం బ్యారేజ్"},
+    "Papikondalu": {"Hindi": "पापिकोंडालु", "Telugu": "పాపికొండలు"},
+    "Godavari River": {"Hindi": "गोदावरी नदी", "Telugu": "గోదావరి నది"},
+    "Simhachalam": {"Hindi": "सिंहाचलम", "Telugu": "సింహాచలం"},
+    "Srikalahasti": {"Hindi": "श्रीकालहस्ती", "Telugu": "శ్రీకాళహస్తి"},
+}
+
+DEITY_GLOSSARY: Dict[str, Dict[str, str]] = {
+    "Lord Venkateswara": {"Hindi": "भगवान वेंकटेश्वर", "Telugu": "శ్రీ వేంకటేశ్వర స్వామి"},
+    "Venkateswara": {"Hindi": "वेंकटेश्वर", "Telugu": "వేంకటేశ్వర"},
+    "Balaji": {"Hindi": "बालाजी", "Telugu": "బాలాజీ"},
+    "Padmavathi": {"Hindi": "पद्मावती", "Telugu": "పద్మావతి"},
+    "Kanaka Durga": {"Hindi": "कनक दुर्गा", "Telugu": "కనక దుర్గ"},
+    "Mallikarjuna": {"Hindi": "मल्लिकार्जुन", "Telugu": "మల్లికార్జున"},
+    "Bhramaramba": {"Hindi": "भ्रमरांबा", "Telugu": "భ్రమరాంబ"},
+    "Narasimha": {"Hindi": "नरसिंह", "Telugu": "నరసింహ"},
+    "Lord Shiva": {"Hindi": "भगवान शिव", "Telugu": "శివుడు"},
+}
+
+DISH_GLOSSARY: Dict[str, Dict[str, str]] = {
+    "Pesarattu": {"Hindi": "पेसरट्टू", "Telugu": "పెసరట్టు"},
+    "Gongura": {"Hindi": "गोंगुरा", "Telugu": "గోంగూర"},
+    "Pulihora": {"Hindi": "पुलिहोरा", "Telugu": "పులిహోర"},
+    "Pootharekulu": {"Hindi": "पूतरेकुलु", "Telugu": "పూతరేకులు"},
+    "Bobbatlu": {"Hindi": "बोब्बट्लु", "Telugu": "బొబ్బట్లు"},
+    "Punugulu": {"Hindi": "पुनुगुलु", "Telugu": "పునుగులు"},
+    "Ulavacharu": {"Hindi": "उलवचारु", "Telugu": "ఉలవచారు"},
+    "Bamboo Chicken": {"Hindi": "बैंबू चिकन", "Telugu": "బొంగు చికెన్"},
+    "Tirupati Laddu": {"Hindi": "तिरुपति लड्डू", "Telugu": "తిరుపతి లడ్డు"},
+    "Andhra Biryani": {"Hindi": "आंध्र बिरयानी", "Telugu": "ఆంధ్ర బిర్యానీ"},
+}
+
+UNIT_GLOSSARY: Dict[str, Dict[str, str]] = {
+    "km": {"Hindi": "किमी", "Telugu": "కి.మీ."},
+    "kms": {"Hindi": "किमी", "Telugu": "కి.మీ."},
+    "kg": {"Hindi": "किग्रा", "Telugu": "కి.గ్రా."},
+}
+
+# Every curated term, used to protect spans during translation
+GLOSSARY: Dict[str, Dict[str, str]] = {**PLACE_GLOSSARY, **DEITY_GLOSSARY, **DISH_GLOSSARY, **UNIT_GLOSSARY}
+
+# Spans that must come back exactly as written: prices, clock times and other numbers
+LITERAL_PATTERN = (
+    r"(?:₹|Rs\.?\s?|INR\s?)\d[\d,]*(?:\.\d+)?"
+    r"|\d{1,2}(?::\d{2})?\s?(?:AM|PM|am|pm)\b"
+    r"|\d{1,2}:\d{2}"
+    r"|\d[\d,]*(?:\.\d+)?"
+)
+
+PLACEHOLDER_PATTERN = re.compile(r"\[\[(\d+)\]\]")
+
+
+def glossary_prompt(language: str, names: Optional[Iterable[str]] = None) -> str:
+    """
+    Render glossary entries as "English = approved form" pairs for a prompt.
+
+    Args:
+        language (str): Target language name
+        names: Optional English names to include; defaults to the whole glossary
+
+    Returns:
+        str: Semicolon-separated pairs, empty if the language has no entries
+    """
+    selected = PLACE_GLOSSARY if names is None else {
+        name: PLACE_GLOSSARY[name] for name in names if name in PLACE_GLOSSARY
+    }
+    return "; ".join(
+        f"{name} = {forms[language]}" for name, forms in selected.items() if language in forms
+    )
+
+
+class GlossaryMatcher:
+    """
+    Masks glossary terms and literals in text so a translator cannot touch them.
+
+    All terms are compiled into one alternation, longest first, so a single
+    left-to-right scan finds every span and "Tirumala Balaji Temple" wins
+    over "Tirumala". HTML tags are matched first and skipped, so attributes
+    are never masked. Each span is replaced by a short `[[n]]` placeholder,
+    which is also cheaper to send and to generate than the name itself.
+    """
+
+    def __init__(self, glossary: Dict[str, Dict[str, str]] = GLOSSARY):
+        self.glossary = {term.lower(): forms for term, forms in glossary.items()}
+        terms = sorted(glossary, key=len, reverse=True)
+        self.pattern = re.compile(
+            r"(?P<tag><[^>]+>)"
+            r"|(?<!\w)(?P<term>" + "|".join(re.escape(term) for term in terms) + r")(?!\w)"
+            r"|(?<![\w.])(?P<literal>" + LITERAL_PATTERN + r")",
+            re.IGNORECASE
+        )
+
+    def mask(self, text: str, language: str) -> Tuple[str, List[str]]:
+        """
+        Replace protected spans with placeholders.
+
+        Args:
+            text (str): English source text
+            language (str): Target language, selects the glossary form
+
+        Returns:
+            tuple: Masked text and the replacement for each placeholder index
+        """
+        replacements: List[str] = []
+
+        def substitute(match) -> str:
+            if match.group("tag"):
+                return match.group(0)
+            if match.group("term"):
+                forms = self.glossary[match.group("term").lower()]
+                replacement = forms.get(language, match.group(0))
+            else:
+                replacement = match.group(0)
+            replacements.append(replacement)
+            return f"[[{len(replacements) - 1}]]"
+
+        return self.pattern.sub(substitute, text), replacements
+
+    def unmask(self, text: str, replacements: List[str]) -> Optional[str]:
+        """
+        Put replacements back in place of placeholders.
+
+        Returns:
+            str: Restored text, or None if the translator dropped or altered a placeholder
+        """
+        seen = set()
+
+        def restore(match) -> str:
+            index = int(match.group(1))
+            if index >= len(replacements):
+                return match.group(0)
+            seen.add(index)
+            return replacements[index]
+
+        restored = PLACEHOLDER_PATTERN.sub(restore, text)
+        if len(seen) != len(replacements):
+            return None
+        return restored
+
+
+_matcher = None
+
+
+def get_matcher() -> GlossaryMatcher:
+    """Return the shared matcher over the full glossary, compiled on first use."""
+    global _matcher
+    if _matcher is None:
+        _matcher = GlossaryMatcher()
+    return _matcher
+
+
+def translate_protected(text: str, language: str, translate: Callable[[str], Optional[str]]) -> Optional[str]:
+    """
+    Translate text with glossary terms, numbers, prices and times protected.
+
+    Args:
+        text (str): English source text
+        language (str): Target language
+        translate: Function translating the masked text, returning None on failure
+
+    Returns:
+        str: Translated text with approved forms restored, or None if translation
+        failed or lost a placeholder
+    """
+    matcher = get_matcher()
+    masked, replacements = matcher.mask(text, language)
+    if not PLACEHOLDER_PATTERN.sub("", masked).strip(" \t\n,.;:-•()/"):
+        # Nothing left to translate (e.g. a bare place name or price)
+        translated = masked
+    else:
+        translated = translate(masked)
+        if not translated:
+            return None
+    return matcher.unmask(translated, replacements)
@@ -1,6 +1,42 @@
 import re
-from typing import Dict, List
+import logging
+from typing import Iterator, List, Optional
 from .gemini_client import GeminiClient
+from .glossary import glossary_prompt
+from .prompts import get_prompt
+from .storage import ResponseCache
+from .trip_parser import TripRequest, parse_trip_request
+from .worker_pool import get_worker_pool
+
+ITINERARY_HEADER = """
+            <h2>🗺️ Your Personalized Andhra Pradesh Travel Itinerary</h2>
+            <p style="margin-bottom: 1rem;"><em>Crafted specially for your journey to the land of rich heritage and culture!</em></p>
+            """
+
+ITINERARY_FOOTER = """
+            <hr style="margin: 1rem 0;">
+            <p><strong>💡 Pro Tips:</strong></p>
+            <p>• Best time to visit: October to March<br>
+            • Carry comfortable walking shoes<br>
+            • Try local Andhra meals at authentic restaurants<br>
+            • Book accommodations in advance during festival seasons<br>
+            • Respect local customs and traditions</p>
+            """
+
+# Used to fill in days the route plan leaves out
+DEFAULT_ROUTE = ["Tirupati", "Visakhapatnam", "Araku Valley", "Vijayawada", "Srisailam", "Horsley Hills", "Amaravati"]
+
+ROUTE_LINE_PATTERN = re.compile(r'day\s*(\d+)\s*[:\-–]\s*(.+)', re.IGNORECASE)
+
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Unicode blocks of the languages that can be generated directly
+SCRIPT_RANGES = {
+    "Hindi": (0x0900, 0x097F),
+    "Telugu": (0x0C00, 0x0C7F)
+}
+# Share of letters that must be in the target script for direct output to be accepted
+MIN_SCRIPT_RATIO = 0.6
 
 class ItineraryGenerator:
     def __init__(self, gemini_client=None):
@@ -11,6 +47,9 @@ class ItineraryGenerator:
             gemini_client: Optional GeminiClient instance. If not provided, a new one will be created.
         """
         self.gemini_client = gemini_client if gemini_client is not None else GeminiClient()
+        # Finished itineraries keyed by the normalized TripRequest, so requests
+        # that only differ in wording share one generation
+        self.itinerary_cache = ResponseCache(self.gemini_client.response_cache.store, "itinerary", ttl=24 * 3600)
     
     def generate_itinerary(self, user_request: str, language: str = "English") -> str:
         """
@@ -24,130 +63,232 @@ class ItineraryGenerator:
             str: Formatted HTML itinerary
         """
         try:
-            # Extract duration from user request
-            duration = self._extract_duration(user_request)
+            # Extract duration, cities, interests etc. from user request
+            trip = parse_trip_request(user_request)
+            cache_key = self._cache_key(trip, language)
+            cached = self.itinerary_cache.get(cache_key)
+            if cached is not None:
+                return cached
             
-            # Create detailed prompt for itinerary generation
-            itinerary_prompt = f"""
-            Create a detailed {duration}-day travel itinerary for Andhra Pradesh based on this request: "{user_request}"
+            # Fixed instructions live in the "itinerary" template's system instruction.
+            # Always generate in English; other languages are translated below.
+            try:
+                itinerary_html = self.gemini_client.generate(
+                    "itinerary", duration=trip.duration_days, trip=trip.describe(), language="English"
+                )
+            except Exception as e:
+                logging.error(f"Error generating itinerary: {str(e)}")
+                itinerary_html = None
+            generated = bool(itinerary_html)
+            if not generated:
+                itinerary_html = self.gemini_client._get_fallback_response("itinerary", "English")
             
-            REQUIREMENTS:
-            - Focus primarily on major cities and attractions in Andhra Pradesh
-            - Include practical details: timings, approximate costs, transportation
-            - Mix of cultural, historical, spiritual, and local experiences
-            - Include local food recommendations for each day
-            - Suggest authentic local experiences
-            - Consider travel time between locations
-            - Include rest periods and meal times
+            itinerary = f"{ITINERARY_HEADER}{itinerary_html}{ITINERARY_FOOTER}"
             
-            FORMAT THE RESPONSE AS HTML WITH THESE ELEMENTS:
-            - Use <h3> for day headers (Day 1, Day 2, etc.)
-            - Use <div class="day-item"> for each day's content
-            - Use <strong> for time slots and important places
-            - Use <br> for line breaks
-            - Include emojis for visual appeal
-            - Use bullet points with • for activities
-            
-            SAMPLE STRUCTURE:
-            <h3>🗓️ Day 1: Arrival & Visakhapatnam Exploration</h3>
-            <div class="day-item">
-            <strong>9:00 AM</strong> - Arrival and hotel check-in<br>
-            <strong>10:30 AM</strong> - Visit Kailasagiri Hill Park 🏔️<br>
-            • Enjoy panoramic views of the city<br>
-            • Entry fee: ₹30 per person<br>
-            <strong>12:30 PM</strong> - Lunch at local Andhra restaurant<br>
-            • Try: Biryani, Pulihora, Andhra meals<br>
-            <strong>2:00 PM</strong> - RK Beach visit 🏖️<br>
-            <strong>Evening</strong> - Local market exploration<br>
-            </div>
+            # Translate to target language if needed
+            if language != "English":
+                itinerary = self._translate(itinerary, language)
             
-            Make it comprehensive, practical, and engaging for travelers!
-            Language: {language}
-            """
+            if generated:
+                self.itinerary_cache.set(cache_key, itinerary)
+            return itinerary
             
-            # Generate itinerary using Gemini
-            itinerary_html = self.gemini_client.get_tourism_response(itinerary_prompt, "English")
+        except Exception as e:
+            return self._error_html(e)
+    
+    def get_cached_itinerary(self, user_request: str, language: str = "English") -> Optional[str]:
+        """Return a previously generated itinerary for an equivalent request, if any."""
+        trip = parse_trip_request(user_request)
+        return self.itinerary_cache.get(self._cache_key(trip, language))
+    
+    def generate_localized_itinerary(self, user_request: str, language: str) -> str:
+        """
+        Generate an itinerary directly in the target language.
+        
+        A single call writes the itinerary in the target script, using the
+        glossary for place names. If the output fails validation (too little
+        target-script text or the wrong number of days), this falls back to
+        generating in English and translating.
+        
+        Args:
+            user_request (str): User's itinerary request
+            language (str): Target language for the itinerary
             
-            # Translate to target language if needed
-            if language != "English":
-                itinerary_html = translation_service.translate_text(itinerary_html, language)
+        Returns:
+            str: Formatted HTML itinerary
+        """
+        if language not in SCRIPT_RANGES:
+            return self.generate_itinerary(user_request, language)
+        
+        try:
+            trip = parse_trip_request(user_request)
+            cache_key = self._cache_key(trip, language)
+            cached = self.itinerary_cache.get(cache_key)
+            if cached is not None:
+                return cached
             
-            return f"""
-            <h2>🗺️ Your Personalized Andhra Pradesh Travel Itinerary</h2>
-            <p style="margin-bottom: 1rem;"><em>Crafted specially for your journey to the land of rich heritage and culture!</em></p>
-            {itinerary_html}
-            <hr style="margin: 1rem 0;">
-            <p><strong>💡 Pro Tips:</strong></p>
-            <p>• Best time to visit: October to March<br>
-            • Carry comfortable walking shoes<br>
-            • Try local Andhra meals at authentic restaurants<br>
-            • Book accommodations in advance during festival seasons<br>
-            • Respect local customs and traditions</p>
-            """
+            itinerary_html = self.gemini_client.generate(
+                "itinerary_localized", duration=trip.duration_days, trip=trip.describe(),
+                language=language, glossary=glossary_prompt(language)
+            )
+        except Exception as e:
+            logging.error(f"Error generating localized itinerary: {str(e)}")
+            itinerary_html = None
+        
+        if itinerary_html and self._is_valid_localized(itinerary_html, language, trip.duration_days):
+            # Header and footer are fixed text, so their translations come from the cache
+            itinerary = f"{self._translate(ITINERARY_HEADER, language)}{itinerary_html}{self._translate(ITINERARY_FOOTER, language)}"
+            self.itinerary_cache.set(cache_key, itinerary)
+            return itinerary
+        
+        logging.warning(f"Direct {language} itinerary failed validation, falling back to translation")
+        return self.generate_itinerary(user_request, language)
+    
+    def stream_itinerary(self, user_request: str, language: str = "English") -> Iterator[str]:
+        """
+        Generate an itinerary day by day, yielding HTML fragments in order.
+        
+        A cheap route-plan call first decides which city to visit on each day.
+        Each day's details are then requested concurrently on the shared worker
+        pool, and days are yielded in order as soon as they (and all earlier
+        days) are ready, so latency no longer grows with trip length.
+        
+        Args:
+            user_request (str): User's itinerary request
+            language (str): Target language for the itinerary
             
+        Yields:
+            str: Header, one HTML block per day, then footer
+        """
+        try:
+            trip = parse_trip_request(user_request)
+            cache_key = self._cache_key(trip, language)
+            cached = self.itinerary_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+            route = self._plan_route(trip)
         except Exception as e:
-            return f"""
+            yield self._error_html(e)
+            return
+        
+        pool = get_worker_pool()
+        futures = [
+            pool.submit(self._generate_day, day, city, trip, language)
+            for day, city in enumerate(route, start=1)
+        ]
+        
+        parts = [ITINERARY_HEADER]
+        complete = True
+        yield ITINERARY_HEADER
+        for day, future in enumerate(futures, start=1):
+            try:
+                part = future.result() + "\n"
+            except Exception as e:
+                # Earlier days are already shown, so fill the gap locally instead of failing the itinerary
+                logging.error(f"Error generating day {day}: {str(e)}")
+                complete = False
+                part = self._fallback_day(day, route[day - 1], language)
+            parts.append(part)
+            yield part
+        parts.append(ITINERARY_FOOTER)
+        yield ITINERARY_FOOTER
+        
+        if complete:
+            self.itinerary_cache.set(cache_key, "".join(parts))
+    
+    def generate_itinerary_parallel(self, user_request: str, language: str = "English") -> str:
+        """Generate an itinerary with per-day parallel requests and return the full HTML."""
+        return "".join(self.stream_itinerary(user_request, language))
+    
+    def _plan_route(self, trip: TripRequest) -> List[str]:
+        """Ask for a short city-per-day route plan, falling back to DEFAULT_ROUTE."""
+        duration = trip.duration_days
+        try:
+            response = self.gemini_client.generate("route_plan", duration=duration, trip=trip.describe()) or ""
+        except Exception as e:
+            logging.error(f"Error planning route: {str(e)}")
+            response = ""
+        
+        cities = {}
+        for line in response.splitlines():
+            match = ROUTE_LINE_PATTERN.search(line.strip().strip('*'))
+            if match:
+                cities[int(match.group(1))] = match.group(2).strip(' *')
+        
+        route = []
+        for day in range(1, duration + 1):
+            if day in cities:
+                route.append(cities[day])
+            elif route and cities:
+                route.append(route[-1])  # Stay on where the plan left a gap
+            else:
+                route.append(DEFAULT_ROUTE[(day - 1) % len(DEFAULT_ROUTE)])
+        return route
+    
+    def _generate_day(self, day: int, city: str, trip: TripRequest, language: str) -> str:
+        """Generate and format the details of a single day."""
+        text = self.gemini_client.generate(
+            "day_details", day=day, duration=trip.duration_days, city=city, trip=trip.describe(), language=language
+        )
+        if not text:
+            raise ValueError(f"No details generated for day {day}")
+        if self._is_html_formatted(text):
+            return text
+        return self._format_as_html(text)
+    
+    def _fallback_day(self, day: int, city: str, language: str) -> str:
+        """Generic plan for a day whose details could not be generated."""
+        html = (
+            f'<h3>🗓️ Day {day}: {city}</h3>\n<div class="day-item">\n'
+            f'<strong>Morning</strong> - Visit the best-known sights of {city} 🏛️<br>\n'
+            f'<strong>Afternoon</strong> - Authentic Andhra meals at a local restaurant, then rest<br>\n'
+            f'<strong>Evening</strong> - Explore the local markets and street food 🛍️<br>\n'
+            f'</div>\n'
+        )
+        if language != "English":
+            html = self._translate(html, language)
+        return html
+    
+    def _is_valid_localized(self, html: str, language: str, duration: int) -> bool:
+        """Check script ratio and day structure of a directly generated itinerary."""
+        low, high = SCRIPT_RANGES[language]
+        letters = [char for char in HTML_TAG_PATTERN.sub(" ", html) if char.isalpha()]
+        if not letters:
+            return False
+        native = sum(1 for char in letters if low <= ord(char) <= high)
+        if native / len(letters) < MIN_SCRIPT_RATIO:
+            return False
+        return html.count("<h3") == duration and html.count('class="day-item"') >= duration
+    
+    def _translate(self, text: str, language: str) -> str:
+        """Translate through the client so results share its translation cache."""
+        return self.gemini_client.translate(text, language)
+    
+    def _cache_key(self, trip: TripRequest, language: str) -> str:
+        # Template versions are part of the key so prompt changes invalidate old itineraries
+        template_tags = [get_prompt(name).cache_tag for name in ("itinerary", "itinerary_localized", "route_plan", "day_details")]
+        return self.itinerary_cache.key(trip.cache_key(), language, *template_tags)
+    
+    def _error_html(self, error: Exception) -> str:
+        return f"""
             <div class="day-item">
             <h3>❌ Unable to Generate Itinerary</h3>
             <p>I apologize, but I couldn't create your itinerary at the moment.</p>
-            <p><strong>Error:</strong> {str(e)}</p>
+            <p><strong>Error:</strong> {str(error)}</p>
             <p>Please try again with a simpler request like "3 day plan for Anand" or "weekend trip to Anand".</p>
             </div>
             """
     
     def _extract_duration(self, user_request: str) -> int:
         """Extract duration in days from user request."""
-        # Look for patterns like "3 days", "5-day", "one week", etc.
-        patterns = [
-            r'(\d+)\s*days?',
-            r'(\d+)-day',
-            r'(\d+)\s*nights?',
-            r'one\s+day' 
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, user_request.lower())
-            if match:
-                if pattern == r'one\s+day':
-                    return 1
-                return int(match.group(1))
-        
-        # Default duration based on request context
-        if any(word in user_request.lower() for word in ['weekend', 'short']):
-            return 2
-        elif any(word in user_request.lower() for word in ['week', 'long', 'extended']):
-            return 7
-        else:
-            return 3  # Default 3-day itinerary
+        return parse_trip_request(user_request).duration_days
     
     def _is_html_formatted(self, text: str) -> bool:
         """Check if text contains HTML formatting."""
         html_tags = ['<h3>', '<div>', '<strong>', '<br>', '<p>']
         return any(tag in text for tag in html_tags)
     
-    def _split_into_chunks(self, text: str, max_length: int = 3000) -> list:
-        """Split text into chunks of maximum length, trying to split at sentence boundaries."""
-        if len(text) <= max_length:
-            return [text]
-            
-        # Try to split at sentence boundaries
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        chunks = []
-        current_chunk = ""
-        
-        for sentence in sentences:
-            if len(current_chunk) + len(sentence) + 1 <= max_length:
-                current_chunk += (sentence + " ")
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence + " "
-        
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-            
-        return chunks
-    
     def _format_as_html(self, text: str) -> str:
         """Convert plain text itinerary to HTML format."""
         lines = text.split('\n')
@@ -0,0 +1,168 @@
+import os
+import sys
+import json
+import zlib
+import logging
+from typing import Iterator, List, Optional
+from .storage import SESSION_TTL_S
+
+# Messages further back than this many turns are kept zlib-compressed.
+DEFAULT_HOT_MESSAGES = 6
+# Per-session budget for in-memory message content in UTF-8 bytes (Hindi/Telugu
+# text takes about 3 bytes per character); older turns spill to the store.
+DEFAULT_MAX_SESSION_BYTES = int(os.getenv("SAANCHARI_SESSION_MAX_BYTES", str(256 * 1024)))
+# Compressing tiny strings costs more than it saves.
+MIN_COMPRESS_BYTES = 512
+
+
+class Message:
+    """
+    A single chat message.
+
+    Content is interned so identical answers (cached responses, the welcome
+    message) share one string across sessions, and `original_content` is only
+    stored when it differs from `content`. Cold messages hold zlib bytes
+    instead of the string and decompress on access. `language` is the
+    language the content was written in, if known.
+    """
+
+    __slots__ = ("role", "type", "language", "_content", "_original", "_compressed", "_nbytes")
+
+    def __init__(self, role: str, content: str, type: str = "", original_content: Optional[str] = None,
+                 language: Optional[str] = None):
+        self.role = sys.intern(role)
+        self.type = sys.intern(type or "")
+        self.language = sys.intern(language) if language else None
+        self._content = sys.intern(content)
+        self._original = None if original_content is None or original_content == content else sys.intern(original_content)
+        self._compressed = None
+        self._nbytes = len(content.encode("utf-8")) + self._original_nbytes()
+
+    def _original_nbytes(self) -> int:
+        return len(self._original.encode("utf-8")) if self._original is not None else 0
+
+    @property
+    def content(self) -> str:
+        if self._compressed is not None:
+            return zlib.decompress(self._compressed).decode("utf-8")
+        return self._content
+
+    @property
+    def original_content(self) -> str:
+        return self._original if self._original is not None else self.content
+
+    @property
+    def nbytes(self) -> int:
+        """UTF-8 bytes held by this message's content (compressed size once cold)."""
+        return self._nbytes
+
+    def compress(self) -> None:
+        if self._compressed is None and len(self._content) >= MIN_COMPRESS_BYTES:
+            self._compressed = zlib.compress(self._content.encode("utf-8"))
+            self._content = None
+            self._nbytes = len(self._compressed) + self._original_nbytes()
+
+    def to_dict(self) -> dict:
+        data = {"role": self.role, "content": self.content}
+        if self.type:
+            data["type"] = self.type
+        if self._original is not None:
+            data["original_content"] = self._original
+        if self.language:
+            data["language"] = self.language
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Message":
+        return cls(data["role"], data["content"], data.get("type", ""), data.get("original_content"),
+                   data.get("language"))
+
+
+class MessageHistory:
+    """
+    Compact, size-capped conversation history for one session.
+
+    Behaves like the list of message dicts it replaces (iteration, len,
+    indexing). When the content held in memory exceeds `max_bytes`, the
+    oldest messages are appended to a spill list in the shared store and
+    dropped from memory; `spilled` counts how many were moved out and
+    `load_spilled()` reads them back. The spill list expires with the session.
+    """
+
+    def __init__(self, session_id: str = "", store=None,
+                 max_bytes: int = DEFAULT_MAX_SESSION_BYTES, hot_messages: int = DEFAULT_HOT_MESSAGES):
+        self.session_id = session_id
+        self.store = store
+        self.max_bytes = max_bytes
+        self.hot_messages = hot_messages
+        self.spilled = 0
+        self._messages: List[Message] = []
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self._messages)
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __getitem__(self, index) -> Message:
+        return self._messages[index]
+
+    def append(self, role: str, content: str, type: str = "", original_content: Optional[str] = None,
+               language: Optional[str] = None) -> Message:
+        message = Message(role, content, type, original_content, language)
+        self._messages.append(message)
+        if len(self._messages) > self.hot_messages:
+            self._messages[-self.hot_messages - 1].compress()
+        self._enforce_cap()
+        return message
+
+    @property
+    def nbytes(self) -> int:
+        return sum(message.nbytes for message in self._messages)
+
+    def _spill_key(self) -> str:
+        return f"saanchari:spill:{self.session_id}"
+
+    def _enforce_cap(self) -> None:
+        total = self.nbytes
+        spill = []
+        # Always keep the newest message, however large it is.
+        while total > self.max_bytes and len(self._messages) > 1:
+            message = self._messages.pop(0)
+            total -= message.nbytes
+            spill.append(message.to_dict())
+        if not spill:
+            return
+        self.spilled += len(spill)
+        if self.store is None or not self.session_id:
+            return
+        try:
+            existing = self.store.get(self._spill_key())
+            archived = json.loads(existing) if existing is not None else []
+            self.store.set(self._spill_key(), json.dumps(archived + spill, ensure_ascii=False), ex=SESSION_TTL_S)
+        except Exception as e:
+            logging.error(f"Could not spill messages for session {self.session_id}: {str(e)}")
+
+    def load_spilled(self) -> List[Message]:
+        """Return messages previously spilled to the store, oldest first."""
+        if self.store is None or not self.session_id:
+            return []
+        try:
+            existing = self.store.get(self._spill_key())
+            return [Message.from_dict(data) for data in json.loads(existing)] if existing is not None else []
+        except Exception as e:
+            logging.error(f"Could not load spilled messages for session {self.session_id}: {str(e)}")
+            return []
+
+    def to_state(self) -> dict:
+        return {"messages": [message.to_dict() for message in self._messages], "spilled": self.spilled}
+
+    @classmethod
+    def from_state(cls, state: Optional[dict], session_id: str = "", store=None, **kwargs) -> "MessageHistory":
+        history = cls(session_id, store, **kwargs)
+        if state:
+            history.spilled = state.get("spilled", 0)
+            for data in state.get("messages", []):
+                history.append(data["role"], data["content"], data.get("type", ""), data.get("original_content"),
+                               data.get("language"))
+        return history
@@ -0,0 +1,222 @@
+import os
+import json
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+from .stats import percentile
+
+T = TypeVar("T")
+
+DEFAULT_TIERS: Dict[str, str] = {
+    "quality": "gemini-1.5-pro",
+    "fast": "gemini-1.5-flash",
+}
+
+DEFAULT_ROUTES: Dict[str, str] = {
+    "ui_translation": "fast",
+    "short_qa": "fast",
+    "tourism": "quality",
+    "itinerary": "quality",
+    "day_details": "quality",
+    "route_plan": "fast",
+    "chunk_translation": "fast",
+}
+
+# Tier that hedged requests are sent to
+HEDGE_TIER = "fast"
+# Hedge delay used until a tier has enough samples for a stable p95
+DEFAULT_HEDGE_DELAY_S = 2.0
+MIN_SAMPLES_FOR_P95 = 20
+
+
+class LatencyTracker:
+    """Rolling window of recent call latencies for one tier."""
+
+    def __init__(self, window: int = 500):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.wins = 0
+        # Results that arrived after a hedge had already won
+        self.late = 0
+
+    def record(self, latency_s: float) -> None:
+        with self._lock:
+            self._samples.append(latency_s)
+            self.calls += 1
+
+    def percentile(self, pct: float) -> Optional[float]:
+        with self._lock:
+            samples = list(self._samples)
+        return percentile(samples, pct) if samples else None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class ModelRouter:
+    """
+    Maps request routes to model tiers and hedges slow primary calls.
+
+    Each route (UI translation, short Q&A, itinerary, chunk translation, ...)
+    is served by the model of its configured tier. When the primary has not
+    answered within the route's observed p95 latency, the same request is
+    also sent to the fast tier and whichever finishes first wins. A primary
+    that fails outright is retried on the fast tier immediately.
+
+    Hedge delays are tracked per route, not per tier: one tier serves both
+    short answers and long itineraries, and a tier-wide p95 would hedge
+    every long generation. A primary that loses to its hedge keeps running,
+    and its result is handed to the caller's `on_late_result` when it
+    arrives, so the caller can still cache the answer it looks up later.
+    """
+
+    def __init__(self, tiers: Optional[Dict[str, str]] = None, routes: Optional[Dict[str, str]] = None,
+                 hedging: bool = True, max_workers: int = 32):
+        self.tiers = dict(DEFAULT_TIERS, **(tiers or {}))
+        self.routes = dict(DEFAULT_ROUTES, **(routes or {}))
+        self.hedging = hedging
+        self.trackers: Dict[str, LatencyTracker] = {tier: LatencyTracker() for tier in self.tiers}
+        # Primary-attempt latency per route, for hedge delays
+        self.route_trackers: Dict[str, LatencyTracker] = {}
+        self._route_lock = threading.Lock()
+        self.hedges_fired = 0
+        # A pool separate from the shared worker pool: callers running on the
+        # worker pool wait on these futures, so sharing it could deadlock.
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="saanchari-hedge")
+
+    @classmethod
+    def from_env(cls) -> "ModelRouter":
+        """
+        Build a router from SAANCHARI_MODEL_TIERS / SAANCHARI_MODEL_ROUTES (JSON
+        objects merged over the defaults) and SAANCHARI_HEDGING ("0" disables).
+        """
+        tiers = json.loads(os.getenv("SAANCHARI_MODEL_TIERS", "{}"))
+        routes = json.loads(os.getenv("SAANCHARI_MODEL_ROUTES", "{}"))
+        return cls(tiers, routes, hedging=os.getenv("SAANCHARI_HEDGING", "1") != "0")
+
+    def tier_for(self, route: str) -> str:
+        return self.routes.get(route, "quality")
+
+    def model_for(self, route: str) -> str:
+        return self.tiers[self.tier_for(route)]
+
+    def _route_tracker(self, route: str) -> LatencyTracker:
+        with self._route_lock:
+            if route not in self.route_trackers:
+                self.route_trackers[route] = LatencyTracker()
+            return self.route_trackers[route]
+
+    def hedge_delay(self, route: str) -> float:
+        tracker = self._route_tracker(route)
+        if len(tracker) < MIN_SAMPLES_FOR_P95:
+            return DEFAULT_HEDGE_DELAY_S
+        return tracker.percentile(95)
+
+    def _timed(self, tier: str, call: Callable[[str], T], route: Optional[str] = None) -> Tuple[T, str]:
+        model = self.tiers[tier]
+        start = time.perf_counter()
+        try:
+            result = call(model)
+        except Exception:
+            self.trackers[tier].errors += 1
+            raise
+        elapsed = time.perf_counter() - start
+        self.trackers[tier].record(elapsed)
+        if route is not None:
+            self._route_tracker(route).record(elapsed)
+        return result, model
+
+    def call(self, route: str, call: Callable[[str], T]) -> T:
+        """
+        Run `call(model_name)` for a route, hedging to the fast tier if needed.
+
+        Args:
+            route (str): Route name, see DEFAULT_ROUTES
+            call: Function that performs the request against the given model
+
+        Returns:
+            The result of whichever attempt finished first without raising
+        """
+        return self.call_with_model(route, call)[0]
+
+    def call_with_model(self, route: str, call: Callable[[str], T],
+                        on_late_result: Optional[Callable[[T], None]] = None) -> Tuple[T, str]:
+        """
+        Like call(), but also return the name of the model that answered.
+
+        If a hedge wins, `on_late_result` is called from a router thread with
+        the primary's result once it finishes successfully.
+        """
+        primary = self.tier_for(route)
+        if not self.hedging or primary == HEDGE_TIER or HEDGE_TIER not in self.tiers:
+            result = self._timed(primary, call, route)
+            self.trackers[primary].wins += 1
+            return result
+
+        futures = {self._pool.submit(self._timed, primary, call, route): primary}
+        done, _ = wait(futures, timeout=self.hedge_delay(route))
+        primary_future = next(iter(futures))
+        if not done or primary_future.exception() is not None:
+            self.hedges_fired += 1
+            futures[self._pool.submit(self._timed, HEDGE_TIER, call)] = HEDGE_TIER
+
+        pending = set(futures)
+        last_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    # The losing attempt keeps running; its latency is still recorded
+                    self.trackers[futures[future]].wins += 1
+                    if future is not primary_future and on_late_result is not None:
+                        primary_future.add_done_callback(
+                            lambda late: self._deliver_late(late, primary, on_late_result)
+                        )
+                    return future.result()
+                last_error = future.exception()
+        logging.error(f"All attempts failed for route {route}: {str(last_error)}")
+        raise last_error
+
+    def _deliver_late(self, future, tier: str, on_late_result: Callable[[T], None]) -> None:
+        if future.exception() is not None:
+            return
+        self.trackers[tier].late += 1
+        try:
+            on_late_result(future.result()[0])
+        except Exception as e:
+            logging.error(f"Handling a late {tier} result failed: {str(e)}")
+
+    def stats(self) -> Dict[str, dict]:
+        """Per-tier call counts, latency percentiles, hedging wins and late results."""
+        return {
+            tier: {
+                "model": self.tiers[tier],
+                "calls": tracker.calls,
+                "errors": tracker.errors,
+                "wins": tracker.wins,
+                "late": tracker.late,
+                "p50_s": tracker.percentile(50),
+                "p95_s": tracker.percentile(95),
+            }
+            for tier, tracker in self.trackers.items()
+        }
+
+
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_router() -> ModelRouter:
+    """Return the process-wide router so latency history is shared by all sessions."""
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = ModelRouter.from_env()
+    return _router
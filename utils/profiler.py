@@ -0,0 +1,163 @@
+import os
+import sys
+import time
+import logging
+import threading
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+PROFILE_DIR = os.getenv("SAANCHARI_PROFILE_DIR", "profiles")
+PROFILE_TOKEN = os.getenv("SAANCHARI_PROFILE_TOKEN")
+SAMPLE_INTERVAL_S = float(os.getenv("SAANCHARI_PROFILE_INTERVAL", "0.005"))
+# Safety net in case a profiler is never stopped
+MAX_PROFILE_S = 300.0
+
+_env_reruns = int(os.getenv("SAANCHARI_PROFILE_RERUNS", "0"))
+_env_lock = threading.Lock()
+
+
+class RerunProfiler:
+    """
+    Sampling profiler for a single Streamlit rerun.
+
+    A daemon thread samples the script thread's stack every `interval_s`
+    until `stop()` is called. Sampling from outside means the profile is
+    complete even when the rerun ends via st.rerun() or st.stop(), which
+    abort the script with an exception. The script ends each rerun
+    explicitly, and `maybe_start_profiler` stops a session's previous
+    profiler before starting the next, because consecutive reruns run on
+    the same thread and cannot be told apart from its stack. Frames of the
+    script itself are labelled by line, so the flame graph shows which part
+    of app.py (CSS injection, logo, get_text, history, LLM call) took time.
+
+    On completion it writes `<stem>.collapsed` (one "a;b;c count" line per
+    stack, for flamegraph.pl or speedscope) and `<stem>.txt` (top functions
+    by self time), tagged with session id, language and route.
+    """
+
+    def __init__(self, script_path: str, output_dir: str = PROFILE_DIR,
+                 interval_s: float = SAMPLE_INTERVAL_S, **tags):
+        self.script_path = os.path.abspath(script_path)
+        self.output_dir = output_dir
+        self.interval_s = interval_s
+        self.tags: Dict[str, str] = {key: str(value) for key, value in tags.items()}
+        self.stacks: Counter = Counter()
+        self._thread_id = threading.get_ident()
+        self._started = time.time()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._run, name="saanchari-profiler", daemon=True)
+
+    def start(self) -> "RerunProfiler":
+        self._sampler.start()
+        return self
+
+    def stop(self) -> None:
+        """End the profile; the files are written by the sampler thread."""
+        self._stop.set()
+
+    def tag(self, **tags) -> None:
+        """Add or replace tags, e.g. the route once it is known."""
+        self.tags.update({key: str(value) for key, value in tags.items()})
+
+    def _label(self, frame) -> str:
+        code = frame.f_code
+        if os.path.abspath(code.co_filename) == self.script_path and code.co_name == "<module>":
+            return f"{os.path.basename(code.co_filename)}:{frame.f_lineno}"
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _sample(self) -> Optional[str]:
+        frame = sys._current_frames().get(self._thread_id)
+        labels = []
+        in_script = False
+        while frame is not None:
+            if os.path.abspath(frame.f_code.co_filename) == self.script_path:
+                in_script = True
+            labels.append(self._label(frame))
+            frame = frame.f_back
+        if not in_script:
+            return None
+        return ";".join(reversed(labels))
+
+    def _run(self) -> None:
+        deadline = self._started + MAX_PROFILE_S
+        while not self._stop.is_set() and time.time() < deadline:
+            # Outside the script (e.g. Streamlit handling st.rerun()) nothing is recorded
+            stack = self._sample()
+            if stack is not None:
+                self.stacks[stack] += 1
+            self._stop.wait(self.interval_s)
+        try:
+            self._write(time.time() - self._started)
+        except Exception as e:
+            logging.error(f"Could not write rerun profile: {str(e)}")
+
+    def _write(self, elapsed_s: float) -> None:
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self._started))
+        tags = "_".join(f"{key}-{value}" for key, value in sorted(self.tags.items()))
+        stem = os.path.join(self.output_dir, f"{stamp}-{int(self._started * 1000) % 1000:03d}_{tags}")
+
+        with open(f"{stem}.collapsed", "w", encoding="utf-8") as collapsed:
+            for stack, count in self.stacks.most_common():
+                collapsed.write(f"{stack} {count}\n")
+
+        self_time = Counter()
+        for stack, count in self.stacks.items():
+            self_time[stack.rsplit(";", 1)[-1]] += count
+        total = sum(self.stacks.values()) or 1
+        with open(f"{stem}.txt", "w", encoding="utf-8") as summary:
+            summary.write(f"tags: {self.tags}\n")
+            summary.write(f"wall time: {elapsed_s:.3f}s, samples: {total}, interval: {self.interval_s * 1000:.1f}ms\n\n")
+            summary.write("self samples  share  frame\n")
+            for label, count in self_time.most_common(30):
+                summary.write(f"{count:>12}  {count / total:>5.1%}  {label}\n")
+
+
+def maybe_start_profiler(session_state, get_query_params: Callable[[], dict],
+                         script_path: str, **tags) -> Optional[RerunProfiler]:
+    """
+    Start a RerunProfiler if this rerun should be profiled.
+
+    Profiling is switched on either for the next SAANCHARI_PROFILE_RERUNS
+    reruns of the process, or for the next N reruns of one session by
+    opening the app with `?profile=N&profile_token=<SAANCHARI_PROFILE_TOKEN>`.
+    With neither configured this returns immediately without reading the
+    query string. Starting a rerun stops the session's previous profiler,
+    and each profile is tagged with a per-session rerun number.
+    """
+    global _env_reruns
+    previous = session_state.get("rerun_profiler")
+    if previous is not None:
+        previous.stop()
+        session_state["rerun_profiler"] = None
+    if not PROFILE_TOKEN and not _env_reruns:
+        return None
+
+    profile = False
+    if _env_reruns:
+        with _env_lock:
+            if _env_reruns > 0:
+                _env_reruns -= 1
+                profile = True
+
+    if PROFILE_TOKEN:
+        params = get_query_params()
+        request = (params.get("profile", [None])[0], params.get("profile_token", [None])[0])
+        # Query params stay in the URL, so arm only once per distinct request
+        if request[0] and request[1] == PROFILE_TOKEN and session_state.get("profile_request") != request:
+            session_state["profile_request"] = request
+            try:
+                session_state["profile_remaining"] = max(0, int(request[0]))
+            except ValueError:
+                logging.error(f"Ignoring invalid profile request: {request[0]!r}")
+        if session_state.get("profile_remaining", 0) > 0:
+            session_state["profile_remaining"] -= 1
+            profile = True
+
+    if not profile:
+        return None
+
+    session_state["profile_rerun"] = session_state.get("profile_rerun", 0) + 1
+    profiler = RerunProfiler(script_path, rerun=session_state["profile_rerun"], **tags).start()
+    session_state["rerun_profiler"] = profiler
+    return profiler
@@ -0,0 +1,164 @@
+from string import Formatter
+from textwrap import dedent
+from typing import Dict, Optional, Tuple
+
+
+class PromptTemplate:
+    """
+    A versioned prompt split into a fixed system instruction and a small
+    content template holding only the per-request slots. `route` is the
+    default ModelRouter route used to pick the model tier.
+
+    The content template is parsed once at registration, so rendering is a
+    single `format_map` and missing slots fail fast with a clear error.
+    Bump `version` whenever the wording changes: it is part of every cache
+    key built from this template, so stale responses are never served.
+    """
+
+    def __init__(self, name: str, version: int, system_instruction: str, content: str,
+                 temperature: Optional[float] = None, max_output_tokens: Optional[int] = None,
+                 route: str = "tourism"):
+        self.name = name
+        self.version = version
+        self.route = route
+        self.system_instruction = dedent(system_instruction).strip()
+        self.content = content
+        self.temperature = temperature
+        self.max_output_tokens = max_output_tokens
+        self.slots: Tuple[str, ...] = tuple(
+            field for _, field, _, _ in Formatter().parse(content) if field
+        )
+
+    @property
+    def cache_tag(self) -> str:
+        return f"{self.name}@v{self.version}"
+
+    def render(self, **slots) -> str:
+        missing = [slot for slot in self.slots if slot not in slots]
+        if missing:
+            raise KeyError(f"Prompt {self.cache_tag} is missing slots: {', '.join(missing)}")
+        return self.content.format_map(slots)
+
+
+PROMPTS: Dict[str, PromptTemplate] = {}
+
+
+def register_prompt(template: PromptTemplate) -> PromptTemplate:
+    PROMPTS[template.name] = template
+    return template
+
+
+def get_prompt(name: str) -> PromptTemplate:
+    try:
+        return PROMPTS[name]
+    except KeyError:
+        raise KeyError(f"Unknown prompt template: {name}")
+
+
+register_prompt(PromptTemplate(
+    name="tourism",
+    version=2,
+    system_instruction="""
+        You are a tourism guide for Andhra Pradesh, India.
+        Provide helpful tourism information about Andhra Pradesh including temples, beaches, food, and attractions.
+        Always respond in the language the user asks for.
+        """,
+    content="User asks: {query}\nRespond in {language}."
+))
+
+ITINERARY_INSTRUCTIONS = """
+        You create detailed travel itineraries for Andhra Pradesh, India.
+        REQUIREMENTS:
+        - Focus primarily on major cities and attractions in Andhra Pradesh
+        - Include practical details: timings, approximate costs, transportation
+        - Mix of cultural, historical, spiritual, and local experiences
+        - Include local food recommendations for each day
+        - Suggest authentic local experiences
+        - Consider travel time between locations
+        - Include rest periods and meal times
+        FORMAT THE RESPONSE AS HTML WITH THESE ELEMENTS:
+        - Use <h3> for day headers (Day 1, Day 2, etc.)
+        - Use <div class="day-item"> for each day's content
+        - Use <strong> for time slots and important places
+        - Use <br> for line breaks
+        - Include emojis for visual appeal
+        - Use bullet points with • for activities
+        SAMPLE STRUCTURE:
+        <h3>🗓️ Day 1: Arrival & Visakhapatnam Exploration</h3>
+        <div class="day-item">
+        <strong>9:00 AM</strong> - Arrival and hotel check-in<br>
+        <strong>10:30 AM</strong> - Visit Kailasagiri Hill Park 🏔️<br>
+        • Enjoy panoramic views of the city<br>
+        • Entry fee: ₹30 per person<br>
+        <strong>12:30 PM</strong> - Lunch at local Andhra restaurant<br>
+        • Try: Biryani, Pulihora, Andhra meals<br>
+        <strong>2:00 PM</strong> - RK Beach visit 🏖️<br>
+        <strong>Evening</strong> - Local market exploration<br>
+        </div>
+        Make it comprehensive, practical, and engaging for travelers!
+        """
+
+register_prompt(PromptTemplate(
+    name="itinerary",
+    version=2,
+    system_instruction=ITINERARY_INSTRUCTIONS,
+    content="Create a detailed {duration}-day travel itinerary. Trip: {trip}\nLanguage: {language}",
+    route="itinerary"
+))
+
+register_prompt(PromptTemplate(
+    name="itinerary_localized",
+    version=1,
+    system_instruction=ITINERARY_INSTRUCTIONS + """
+        LANGUAGE:
+        - Write all text directly in the requested language, in its native script
+        - Keep the HTML tags, emojis, numbers, prices and times exactly as in the sample
+        - Write place names exactly as given in the glossary
+        """,
+    content="Create a detailed {duration}-day travel itinerary. Trip: {trip}\nWrite it in {language}.\nGlossary: {glossary}",
+    route="itinerary"
+))
+
+register_prompt(PromptTemplate(
+    name="route_plan",
+    version=1,
+    system_instruction="""
+        You plan routes for trips in Andhra Pradesh, India.
+        Choose one Andhra Pradesh city or destination for each day, considering travel time between locations.
+        Reply only with one line per day in the form "Day N: City" and nothing else.
+        """,
+    content="ROUTE PLAN: a {duration} day trip. Trip: {trip}",
+    temperature=0.3,
+    max_output_tokens=200,
+    route="route_plan"
+))
+
+register_prompt(PromptTemplate(
+    name="day_details",
+    version=1,
+    system_instruction="""
+        You write one day of an Andhra Pradesh travel itinerary.
+        REQUIREMENTS:
+        - Include practical details: timings, approximate costs, transportation
+        - Include local food recommendations and authentic local experiences
+        - Include rest periods and meal times
+        FORMAT AS PLAIN TEXT:
+        - First line: "Day N: <title>"
+        - One line per time slot: "9:00 AM - activity"
+        - Details on lines starting with "- "
+        """,
+    content="DAY DETAILS: Write Day {day} of {duration} of an Andhra Pradesh trip, spent in {city}. Trip: {trip}\nLanguage: {language}",
+    route="day_details"
+))
+
+register_prompt(PromptTemplate(
+    name="translation",
+    version=2,
+    system_instruction="""
+        You are a translator. Only return the translated text without any additional text or explanations.
+        Keep HTML tags, emojis, numbers, prices and times unchanged.
+        Copy placeholders such as [[0]] exactly as they are; they stand for names that are already translated.
+        """,
+    content="Translate the following text to {language}. Here's the text to translate: \"{text}\"",
+    route="chunk_translation"
+))
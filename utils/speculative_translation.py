@@ -0,0 +1,149 @@
+import os
+import time
+import logging
+import threading
+from collections import deque
+from typing import Iterable, Optional, Tuple
+
+from .admission import get_admission_controller
+from .gemini_client import GeminiClient
+from .worker_pool import get_worker_pool
+
+# Background translations running at once; the rest of the shared pool stays free for live requests
+DEFAULT_MAX_RUNNING = int(os.getenv("SAANCHARI_SPECULATIVE_MAX_RUNNING", "4"))
+# How long to wait before checking the load again while paused
+PAUSE_S = 0.1
+# New jobs are dropped once this many are pending
+MAX_PENDING = 256
+
+
+class SpeculativeTranslator:
+    """
+    Translates new assistant messages into the other languages in the background.
+
+    Each answer or itinerary is queued once it has been shown, one job per
+    other language. A dispatcher thread feeds the shared worker pool at most
+    `max_running` jobs at a time, and only while live requests leave
+    admission slots free and nobody is queued, so speculation only uses
+    spare capacity and pauses under live traffic. Results land
+    in GeminiClient's translation cache, keyed by message content and target
+    language, where `lookup()` finds them without any API call.
+    """
+
+    def __init__(self, client: GeminiClient, languages: Iterable[str], admission=None, pool=None,
+                 max_running: int = DEFAULT_MAX_RUNNING, max_pending: int = MAX_PENDING):
+        self.client = client
+        self.languages = list(languages)
+        self.admission = admission or get_admission_controller()
+        self.pool = pool or get_worker_pool()
+        self.max_running = max_running
+        self.max_pending = max_pending
+
+        self.running = 0
+        self.counts = {"queued": 0, "translated": 0, "failed": 0, "dropped": 0, "paused": 0, "hits": 0, "misses": 0}
+        self._pending: "deque[Tuple[str, str, str]]" = deque()
+        self._queued_keys = set()
+        self._cond = threading.Condition()
+        self._dispatcher = threading.Thread(target=self._dispatch, name="saanchari-speculative", daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, content: str, source_language: str) -> None:
+        """Queue `content` for translation into every other language."""
+        for language in self.languages:
+            if language != source_language:
+                self._enqueue((content, source_language, language), urgent=False)
+
+    def lookup(self, content: str, source_language: str, language: str) -> Optional[str]:
+        """
+        Return a cached translation without calling the API.
+
+        A miss queues the translation ahead of speculative work, so it is
+        ready on a later rerun.
+        """
+        if language == source_language:
+            return content
+        translated = self.client.translate(content, language, cache_only=True, source_language=source_language)
+        with self._cond:
+            self.counts["hits" if translated is not None else "misses"] += 1
+        if translated is None:
+            self._enqueue((content, source_language, language), urgent=True)
+        return translated
+
+    def _enqueue(self, job: Tuple[str, str, str], urgent: bool) -> None:
+        with self._cond:
+            if job in self._queued_keys:
+                return
+            self._queued_keys.add(job)
+            if urgent:
+                self._pending.appendleft(job)
+            else:
+                self._pending.append(job)
+            self.counts["queued"] += 1
+            if len(self._pending) > self.max_pending:
+                self._queued_keys.discard(self._pending.pop())
+                self.counts["dropped"] += 1
+            self._cond.notify()
+
+    def _busy(self) -> bool:
+        # Background calls are not admitted, so count them against the live in-flight limit
+        metrics = self.admission.metrics()
+        return metrics["queue_depth"] > 0 or metrics["in_flight"] + self.running >= self.admission.max_in_flight
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending or self.running >= self.max_running:
+                    self._cond.wait()
+            if self._busy():
+                with self._cond:
+                    self.counts["paused"] += 1
+                time.sleep(PAUSE_S)
+                continue
+            with self._cond:
+                job = self._pending.popleft()
+                self.running += 1
+            try:
+                self.pool.submit(self._run, job)
+            except RuntimeError:
+                # The pool was shut down, e.g. at interpreter exit
+                return
+
+    def _run(self, job: Tuple[str, str, str]) -> None:
+        content, source_language, language = job
+        try:
+            # Returns straight from the cache if another session already did the work
+            self.client.translate(content, language, source_language=source_language)
+            translated = self.client.translate(content, language, cache_only=True, source_language=source_language)
+            outcome = "translated" if translated is not None else "failed"
+        except Exception as e:
+            logging.error(f"Speculative translation to {language} failed: {str(e)}")
+            outcome = "failed"
+        with self._cond:
+            self.counts[outcome] += 1
+            self.running -= 1
+            self._queued_keys.discard(job)
+            self._cond.notify()
+
+    def metrics(self) -> dict:
+        with self._cond:
+            lookups = self.counts["hits"] + self.counts["misses"]
+            return dict(
+                self.counts,
+                pending=len(self._pending),
+                running=self.running,
+                hit_rate=self.counts["hits"] / lookups if lookups else 0.0,
+            )
+
+
+_translator = None
+_translator_lock = threading.Lock()
+
+
+def get_speculative_translator(client: GeminiClient, languages: Iterable[str]) -> SpeculativeTranslator:
+    """Return the process-wide translator; the first caller's client and languages are used."""
+    global _translator
+    if _translator is None:
+        with _translator_lock:
+            if _translator is None:
+                _translator = SpeculativeTranslator(client, languages)
+    return _translator
@@ -0,0 +1,16 @@
+from typing import Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile, as reported by the benchmarks and the router.
+
+    Args:
+        values (Sequence[float]): Samples, in any order; must not be empty
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The sample at that rank
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
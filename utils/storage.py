@@ -0,0 +1,303 @@
+import os
+import time
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+DEFAULT_STORE_URL = "sqlite:///.saanchari_store.sqlite3"
+# Idle sessions (and their spilled history) expire after a week
+SESSION_TTL_S = 7 * 24 * 3600
+KEY_PREFIX = "saanchari"
+# SQLiteStore deletes expired rows once every this many writes per process
+PURGE_EVERY_WRITES = 500
+
+Value = Union[bytes, str]
+
+
+def _to_bytes(value: Value) -> bytes:
+    return value.encode("utf-8") if isinstance(value, str) else bytes(value)
+
+
+class MemoryStore:
+    """
+    In-process key-value store.
+
+    Exposes the same subset of the Redis client API as SQLiteStore
+    (get/set/delete/exists/incr) so callers never need to know which
+    backend they are talking to. Data is private to the current process.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Value, ex: Optional[float] = None) -> bool:
+        expires_at = time.time() + ex if ex else None
+        with self._lock:
+            self._data[key] = (_to_bytes(value), expires_at)
+        return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    def exists(self, key: str) -> int:
+        return 1 if self.get(key) is not None else 0
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        with self._lock:
+            value, expires_at = self._data.get(key, (b"0", None))
+            if expires_at is not None and expires_at <= time.time():
+                value, expires_at = b"0", None
+            new_value = int(value) + amount
+            self._data[key] = (str(new_value).encode("utf-8"), expires_at)
+            return new_value
+
+
+class SQLiteStore:
+    """
+    Key-value store backed by a SQLite database in WAL mode.
+
+    Every Streamlit worker on the same machine that points at the same file
+    shares conversation state and caches. WAL lets readers proceed while a
+    writer commits, so cache lookups never block on another worker's insert.
+    Expired rows are dropped on read and purged in bulk every
+    `purge_every` writes, so keys that are never read again do not grow
+    the file forever.
+    """
+
+    def __init__(self, path: str, purge_every: int = PURGE_EVERY_WRITES):
+        self.path = path
+        self.purge_every = purge_every
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads, and
+        # Streamlit serves every session from its own thread.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _wrote(self) -> None:
+        with self._writes_lock:
+            self._writes += 1
+            due = self._writes % self.purge_every == 0
+        if due:
+            self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """
+        Delete every expired row.
+
+        Returns:
+            int: Number of rows deleted
+        """
+        try:
+            cursor = self._connection().execute(
+                "DELETE FROM kv WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+            )
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            # Another worker holding the write lock is not worth failing a set() over
+            logging.error(f"Purging expired store rows failed: {str(e)}")
+            return 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM kv WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(key)
+            return None
+        return bytes(value)
+
+    def set(self, key: str, value: Value, ex: Optional[float] = None) -> bool:
+        expires_at = time.time() + ex if ex else None
+        self._connection().execute(
+            "INSERT OR REPLACE INTO kv (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, sqlite3.Binary(_to_bytes(value)), expires_at)
+        )
+        self._wrote()
+        return True
+
+    def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        placeholders = ",".join("?" for _ in keys)
+        cursor = self._connection().execute(
+            f"DELETE FROM kv WHERE key IN ({placeholders})", keys
+        )
+        return cursor.rowcount
+
+    def exists(self, key: str) -> int:
+        return 1 if self.get(key) is not None else 0
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT value, expires_at FROM kv WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[1] is not None and row[1] <= time.time():
+                row = None
+            # Keep the key's TTL, like MemoryStore and Redis INCR
+            value, expires_at = row if row is not None else (b"0", None)
+            new_value = int(bytes(value)) + amount
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, str(new_value).encode("utf-8"), expires_at)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self._wrote()
+        return new_value
+
+
+def create_store(url: str):
+    """
+    Create a key-value store from a URL.
+
+    Supported URLs:
+        memory://                 per-process store
+        sqlite:///path/to/file    shared between processes on one machine
+        redis://host:port/db      shared between machines (needs `redis`)
+    """
+    parsed = urlparse(url)
+    if parsed.scheme == "memory":
+        return MemoryStore()
+    if parsed.scheme == "sqlite":
+        path = url[len("sqlite:///"):] if url.startswith("sqlite:///") else parsed.path
+        return SQLiteStore(path)
+    if parsed.scheme in ("redis", "rediss", "unix"):
+        # redis-py already implements the interface above.
+        import redis
+        return redis.Redis.from_url(url)
+    raise ValueError(f"Unsupported store URL: {url}")
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Return the process-wide store configured by SAANCHARI_STORE_URL."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                url = os.getenv("SAANCHARI_STORE_URL", DEFAULT_STORE_URL)
+                try:
+                    _store = create_store(url)
+                except Exception as e:
+                    logging.error(f"Could not open store {url}: {str(e)}")
+                    _store = MemoryStore()
+    return _store
+
+
+class ResponseCache:
+    """
+    Namespaced cache of text responses on top of a key-value store.
+
+    Keys are hashed from their parts so arbitrarily long prompts map to
+    fixed-size store keys. Store errors are logged and treated as misses so
+    that a broken cache never breaks a user request.
+    """
+
+    def __init__(self, store, namespace: str, ttl: Optional[float] = None):
+        self.store = store
+        self.namespace = namespace
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, *parts) -> str:
+        digest = hashlib.sha1("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}:{self.namespace}:{digest}"
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            value = self.store.get(key)
+        except Exception as e:
+            logging.error(f"Cache read failed for {self.namespace}: {str(e)}")
+            value = None
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value.decode("utf-8")
+
+    def set(self, key: str, value: str) -> None:
+        try:
+            self.store.set(key, value, ex=self.ttl)
+        except Exception as e:
+            logging.error(f"Cache write failed for {self.namespace}: {str(e)}")
+
+    def get_or_compute(self, key: str, compute: Callable[[], Optional[str]]) -> Optional[str]:
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if value:
+                self.set(key, value)
+        return value
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SessionStore:
+    """Conversation history persisted in the shared store, keyed by session id."""
+
+    def __init__(self, store, ttl: Optional[float] = SESSION_TTL_S):
+        self.store = store
+        self.ttl = ttl
+
+    def _key(self, session_id: str) -> str:
+        return f"{KEY_PREFIX}:session:{session_id}"
+
+    def load(self, session_id: str) -> Optional[dict]:
+        try:
+            value = self.store.get(self._key(session_id))
+            return json.loads(value) if value is not None else None
+        except Exception as e:
+            logging.error(f"Could not load session {session_id}: {str(e)}")
+            return None
+
+    def save(self, session_id: str, state: dict) -> None:
+        try:
+            self.store.set(self._key(session_id), json.dumps(state, ensure_ascii=False), ex=self.ttl)
+        except Exception as e:
+            logging.error(f"Could not save session {session_id}: {str(e)}")
@@ -1,5 +1,6 @@
 from deep_translator import GoogleTranslator
 import logging
+from .glossary import translate_protected
 
 class Translator:
     def __init__(self):
@@ -36,8 +37,12 @@ class Translator:
             
             # Translate text using deep-translator
             translator = GoogleTranslator(source=source_code, target=target_code)
-            result = translator.translate(text)
+            if source_lang != "English":
+                result = translator.translate(text)
+                return result if result else text
             
+            # Glossary terms, numbers, prices and times keep their approved forms
+            result = translate_protected(text, target_lang, translator.translate)
             return result if result else text
             
         except Exception as e:
@@ -0,0 +1,283 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from .glossary import PLACE_GLOSSARY
+
+DEFAULT_DURATION = 3
+# Longest itinerary we generate; parallel mode makes one model call per day
+MAX_DURATION_DAYS = 14
+
+NUMBER_WORDS: Dict[str, int] = {
+    # English
+    "one": 1, "a": 1, "single": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+    "thirteen": 13, "fourteen": 14, "fifteen": 15,
+    # Hindi
+    "एक": 1, "दो": 2, "तीन": 3, "चार": 4, "पांच": 5, "पाँच": 5, "छह": 6, "छः": 6,
+    "सात": 7, "आठ": 8, "नौ": 9, "दस": 10,
+    # Telugu
+    "ఒక": 1, "ఒకటి": 1, "రెండు": 2, "మూడు": 3, "నాలుగు": 4, "ఐదు": 5, "ఆరు": 6,
+    "ఏడు": 7, "ఎనిమిది": 8, "తొమ్మిది": 9, "పది": 10,
+}
+
+# Unit word -> days per unit, and whether it counts nights
+DURATION_UNITS: Dict[str, Tuple[int, bool]] = {
+    "day": (1, False), "days": (1, False), "दिन": (1, False), "దినం": (1, False),
+    "రోజు": (1, False), "రోజులు": (1, False), "రోజుల": (1, False),
+    "night": (1, True), "nights": (1, True), "रात": (1, True), "रातें": (1, True),
+    "రాత్రి": (1, True), "రాత్రులు": (1, True),
+    "week": (7, False), "weeks": (7, False), "हफ्ता": (7, False), "हफ्ते": (7, False),
+    "सप्ताह": (7, False), "వారం": (7, False), "వారాలు": (7, False),
+}
+
+# Bare words that imply a duration when no explicit count is given, in
+# priority order: "long weekend" is a weekend, as it always was
+DURATION_WORDS: Dict[str, int] = {
+    "weekend": 2, "वीकेंड": 2, "వీకెండ్": 2, "fortnight": 14, "पखवाड़ा": 14,
+    "short": 2, "week": 7, "long": 7, "extended": 7,
+}
+_SPAN_RANK = {word: rank for rank, word in enumerate(DURATION_WORDS)}
+
+# Destinations: every glossary place (except the state itself) in all its
+# forms, plus spellings and nearby-town aliases the glossary does not list
+CITY_ALIASES: Dict[str, str] = {
+    form.lower(): name
+    for name, forms in PLACE_GLOSSARY.items() if name != "Andhra Pradesh"
+    for form in [name, *forms.values()]
+}
+CITY_ALIASES.update({
+    "tirupati": "Tirupati", "tirumala": "Tirupati", "तिरुपति": "Tirupati", "తిరుపతి": "Tirupati",
+    "తిరుమల": "Tirupati",
+    "तिरुमला": "Tirupati",
+    "visakhapatnam": "Visakhapatnam", "vizag": "Visakhapatnam", "vishakhapatnam": "Visakhapatnam",
+    "विशाखापत्तनम": "Visakhapatnam", "విశాఖపట్నం": "Visakhapatnam", "విశాఖ": "Visakhapatnam",
+    "विजाग": "Visakhapatnam", "వైజాగ్": "Visakhapatnam",
+    "araku": "Araku Valley", "अराकू": "Araku Valley", "అరకు": "Araku Valley",
+    "vijayawada": "Vijayawada", "विजयवाड़ा": "Vijayawada", "విజయవాడ": "Vijayawada",
+    "srisailam": "Srisailam", "श्रीशैलम": "Srisailam", "శ్రీశైలం": "Srisailam",
+    "amaravati": "Amaravati", "अमरावती": "Amaravati", "అమరావతి": "Amaravati",
+    "horsley hills": "Horsley Hills", "హార్సిలీ హిల్స్": "Horsley Hills",
+    "rajahmundry": "Rajahmundry", "rajamahendravaram": "Rajahmundry", "రాజమండ్రి": "Rajahmundry",
+    "guntur": "Guntur", "గుంటూరు": "Guntur",
+    "nellore": "Nellore", "నెల్లూరు": "Nellore",
+    "kurnool": "Kurnool", "కర్నూలు": "Kurnool",
+    "lepakshi": "Lepakshi", "లేపాక్షి": "Lepakshi",
+    "gandikota": "Gandikota", "గండికోట": "Gandikota",
+    "puttaparthi": "Puttaparthi", "పుట్టపర్తి": "Puttaparthi",
+    "kakinada": "Kakinada", "కాకినాడ": "Kakinada",
+    "anantapur": "Anantapur", "అనంతపురం": "Anantapur",
+})
+
+INTEREST_ALIASES: Dict[str, str] = {
+    "temple": "temples", "temples": "temples", "spiritual": "temples", "pilgrimage": "temples",
+    "darshan": "temples", "मंदिर": "temples", "దేవాలయం": "temples", "దేవాలయాలు": "temples", "దేవాలయాల": "temples", "ఆలయం": "temples",
+    "beach": "beaches", "beaches": "beaches", "coast": "beaches", "समुद्र": "beaches", "బీచ్": "beaches",
+    "తీరం": "beaches",
+    "food": "food", "cuisine": "food", "biryani": "food", "भोजन": "food", "వంటకాలు": "food",
+    "trek": "nature", "trekking": "nature", "hill": "nature", "hills": "nature", "nature": "nature", "waterfall": "nature",
+    "waterfalls": "nature", "wildlife": "nature", "caves": "nature",
+    "history": "heritage", "historical": "heritage", "heritage": "heritage", "fort": "heritage",
+    "museum": "heritage", "culture": "heritage",
+    "shopping": "shopping", "market": "shopping", "markets": "shopping",
+    "adventure": "adventure", "water sports": "adventure",
+}
+
+BUDGET_WORDS: Dict[str, str] = {
+    "budget": "budget", "cheap": "budget", "affordable": "budget", "low cost": "budget",
+    "backpacking": "budget", "सस्ता": "budget",
+    "luxury": "luxury", "premium": "luxury", "5 star": "luxury", "five star": "luxury",
+    "mid-range": "mid-range", "moderate": "mid-range",
+}
+
+MONTHS: Dict[str, str] = {}
+for _name in ["january", "february", "march", "april", "may", "june", "july",
+              "august", "september", "october", "november", "december"]:
+    MONTHS[_name] = _name.capitalize()
+    if _name != "may":
+        MONTHS[_name[:3]] = _name.capitalize()
+# Plain "may" is far more often the verb
+del MONTHS["may"]
+MONTHS.update({
+    "in may": "May", "may month": "May",
+    "जनवरी": "January", "फरवरी": "February", "मार्च": "March", "अप्रैल": "April", "मई": "May",
+    "जून": "June", "जुलाई": "July", "अगस्त": "August", "सितंबर": "September", "अक्टूबर": "October",
+    "नवंबर": "November", "दिसंबर": "December",
+    "జనవరి": "January", "ఫిబ్రవరి": "February", "మార్చి": "March", "ఏప్రిల్": "April", "మే": "May",
+    "జూన్": "June", "జూలై": "July", "ఆగస్టు": "August", "సెప్టెంబర్": "September", "అక్టోబర్": "October",
+    "నవంబర్": "November", "డిసెంబర్": "December",
+})
+
+
+# Words that carry no trip detail; whatever else is left over after parsing is
+# kept verbatim so unrecognized places and wishes still reach the model
+FILLER_WORDS = {
+    "a", "an", "the", "i", "me", "my", "we", "us", "our", "to", "for", "in", "on", "at", "of", "and",
+    "with", "please", "can", "you", "help", "plan", "planning", "make", "create", "give", "want", "would",
+    "like", "need", "suggest", "trip", "trips", "tour", "tours", "itinerary", "schedule", "travel", "visit", "vacation",
+    "holiday", "andhra", "pradesh", "ap", "day", "days",
+    "मेरे", "मेरी", "लिए", "की", "का", "के", "में", "एक", "यात्रा", "योजना", "कार्यक्रम", "ट्रिप", "बनाएं",
+    "बनाइए", "आंध्र", "प्रदेश", "मुझे", "मैं", "हम", "हमें", "हमारे", "हमारी", "को", "से", "पर", "और", "है",
+    "हैं", "हूं", "हूँ", "कृपया", "मदद", "सहायता", "करें", "करो", "कीजिए", "करना", "करने", "बनाने", "बनाना",
+    "बनाओ", "चाहिए", "चाहता", "चाहती", "चाहते", "सुझाव", "सुझाएं", "बताएं", "बताइए", "घूमने", "प्लान", "टूर",
+    "दिन", "दिनों",
+    "నా", "కోసం", "ఒక", "లో", "ప్రయాణం", "ప్రయాణ", "ప్రణాళిక", "కార్యక్రమం", "ట్రిప్", "ఆంధ్ర", "ప్రదేశ్",
+    "ఆంధ్రప్రదేశ్", "నాకు", "మాకు", "మా", "నేను", "మేము", "దయచేసి", "సహాయం", "చేయండి", "చేయడం", "చేయి",
+    "చేసి", "ప్లాన్", "పర్యటన", "యాత్ర", "టూర్", "కావాలి", "చూడాలి", "సూచించండి", "చెప్పండి", "మరియు", "రోజు",
+    "రోజులు", "రోజుల",
+}
+# Telugu attaches case endings to the word, e.g. "ఆంధ్రప్రదేశ్‌కు" (to Andhra
+# Pradesh), so a word is also filler if it is filler plus one of these
+TELUGU_CASE_ENDINGS = ("నికి", "లకు", "ను", "కు", "కి", "లో", "ని", "తో")
+# Upper bound on kept words, so a long message cannot bloat every prompt
+MAX_NOTE_WORDS = 12
+_NOTE_TOKEN = re.compile(r'[^\s,.;:!?()"\'/|-]+')
+
+
+def _alternation(words) -> str:
+    # Longest first so "రోజులు" wins over "రోజు" and "horsley hills" over "hills"
+    return "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+# Latin words need explicit boundaries; Indic words are matched as-is since
+# their vowel signs are not \w and would break \b.
+_LATIN_START = r'(?<![a-z0-9])'
+_LATIN_END = r'(?![a-z])'
+# Inflected endings after an Indic city or interest ("విశాఖపట్నానికి") belong to that word
+_INDIC_TAIL = r'[\u0900-\u0d7f\u200c\u200d]*'
+
+TRIP_PATTERN = re.compile(
+    rf'(?P<count>\d+|{_LATIN_START}(?:{_alternation(w for w in NUMBER_WORDS if w.isascii())}){_LATIN_END}'
+    rf'|{_alternation(w for w in NUMBER_WORDS if not w.isascii())})'
+    rf'\s*-?\s*(?P<unit>{_alternation(DURATION_UNITS)}){_LATIN_END}'
+    rf'|(?P<amount>(?:₹|{_LATIN_START}(?:rs\.?|inr))\s*\d[\d,]*(?:\s*k{_LATIN_END})?'
+    rf'|\d[\d,]*\s*(?:k\s*)?(?:rupees|rs|inr){_LATIN_END})'
+    rf'|{_LATIN_START}(?P<city>{_alternation(CITY_ALIASES)}){_INDIC_TAIL}{_LATIN_END}'
+    rf'|{_LATIN_START}(?P<interest>{_alternation(INTEREST_ALIASES)}){_INDIC_TAIL}{_LATIN_END}'
+    rf'|{_LATIN_START}(?P<budget>{_alternation(BUDGET_WORDS)}){_LATIN_END}'
+    rf'|{_LATIN_START}(?P<month>{_alternation(MONTHS)}){_LATIN_END}'
+    rf'|{_LATIN_START}(?P<span>{_alternation(DURATION_WORDS)}){_LATIN_END}'
+)
+
+
+@dataclass(frozen=True)
+class TripRequest:
+    """Normalized trip parameters extracted from a free-text request."""
+
+    duration_days: int = DEFAULT_DURATION
+    cities: Tuple[str, ...] = ()
+    interests: Tuple[str, ...] = ()
+    budget: Optional[str] = None
+    month: Optional[str] = None
+    # Unrecognized remainder of the request, e.g. a place missing from CITY_ALIASES
+    notes: str = ""
+
+    def cache_key(self) -> str:
+        """Stable key: requests that differ only in wording share an itinerary."""
+        return "|".join([
+            str(self.duration_days),
+            ",".join(sorted(self.cities)),
+            ",".join(sorted(self.interests)),
+            self.budget or "",
+            self.month or "",
+            self.notes,
+        ])
+
+    def describe(self) -> str:
+        """Compact slot summary used in prompts instead of the raw request."""
+        slots = [f"{self.duration_days} days"]
+        if self.cities:
+            slots.append("cities: " + ", ".join(self.cities))
+        if self.interests:
+            slots.append("interests: " + ", ".join(self.interests))
+        if self.budget:
+            slots.append(f"budget: {self.budget}")
+        if self.month:
+            slots.append(f"month: {self.month}")
+        if self.notes:
+            slots.append(f"also mentioned: {self.notes}")
+        return "; ".join(slots)
+
+
+def _parse_amount(text: str) -> Optional[str]:
+    try:
+        digits = re.sub(r'[^\d]', '', text)
+        amount = int(digits) * (1000 if re.search(r'\d\s*k', text) else 1)
+    except ValueError:
+        return None
+    return f"₹{amount:,}"
+
+
+def _leftover_notes(text: str, spans: List[Tuple[int, int]]) -> str:
+    """Words of `text` outside the matched spans, minus filler and bare numbers."""
+    pieces, position = [], 0
+    for start, end in spans:
+        pieces.append(text[position:start])
+        position = end
+    pieces.append(text[position:])
+    words = [word for word in _NOTE_TOKEN.findall(" ".join(pieces)) if not _is_filler(word)]
+    return " ".join(words[:MAX_NOTE_WORDS])
+
+
+def _is_filler(word: str) -> bool:
+    word = word.replace("\u200c", "").replace("\u200d", "")
+    if word in FILLER_WORDS or word in NUMBER_WORDS or word.isdigit():
+        return True
+    return any(word.endswith(ending) and word[:-len(ending)] in FILLER_WORDS for ending in TELUGU_CASE_ENDINGS)
+
+
+def parse_trip_request(user_request: str) -> TripRequest:
+    """
+    Parse duration, cities, interests, budget and month in a single scan.
+
+    Args:
+        user_request (str): Free-text request in English, Hindi or Telugu
+
+    Returns:
+        TripRequest: Normalized trip parameters
+    """
+    text = user_request.lower()
+    days = nights = None
+    span_words = []
+    cities, interests = [], []
+    budget = month = None
+    spans = []
+
+    for match in TRIP_PATTERN.finditer(text):
+        kind = match.lastgroup
+        spans.append(match.span())
+        if match.group("count"):
+            count = match.group("count")
+            count = int(count) if count.isdigit() else NUMBER_WORDS[count]
+            per_unit, is_night = DURATION_UNITS[match.group("unit")]
+            if is_night:
+                nights = nights or count
+            else:
+                days = days or count * per_unit
+        elif kind == "amount":
+            # An explicit amount is more specific than a budget word
+            budget = _parse_amount(match.group("amount")) or budget
+        elif kind == "city":
+            city = CITY_ALIASES[match.group("city")]
+            if city not in cities:
+                cities.append(city)
+        elif kind == "interest":
+            interest = INTEREST_ALIASES[match.group("interest")]
+            if interest not in interests:
+                interests.append(interest)
+        elif kind == "budget":
+            budget = budget or BUDGET_WORDS[match.group("budget")]
+        elif kind == "month":
+            month = month or MONTHS[match.group("month")]
+        elif kind == "span":
+            span_words.append(match.group("span"))
+
+    span = DURATION_WORDS[min(span_words, key=_SPAN_RANK.get)] if span_words else None
+    duration = days or nights or span or DEFAULT_DURATION
+    return TripRequest(
+        duration_days=min(MAX_DURATION_DAYS, max(1, duration)),
+        cities=tuple(cities),
+        interests=tuple(interests),
+        budget=budget,
+        month=month,
+        notes=_leftover_notes(text, spans),
+    )
@@ -0,0 +1,24 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_WORKER_THREADS = int(os.getenv("SAANCHARI_WORKER_THREADS", "16"))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> ThreadPoolExecutor:
+    """
+    Return the process-wide thread pool for concurrent backend calls.
+
+    Streamlit runs every session in the same process, so sharing one pool
+    bounds the total number of in-flight requests regardless of how many
+    users are active.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=DEFAULT_WORKER_THREADS, thread_name_prefix="saanchari")
+    return _pool